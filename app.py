@@ -14,6 +14,10 @@ import streamlit as st
 from pathlib import Path
 import logging
 import time
+import tempfile
+import shutil
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Set environment variables from .env (if not already set) ---
 from dotenv import load_dotenv
@@ -21,11 +25,16 @@ load_dotenv()
 
 os.environ["HF_HOME"] = os.getenv("HF_HOME", os.path.expanduser("~/.cache/huggingface/hub"))
 chroma_db_dir = os.getenv("CHROMA_DB_DIR", "chroma_db")
+embedding_cache_dir = os.getenv("EMBEDDING_CACHE_DIR", "embedding_cache")
+semantic_cache_path = os.getenv("SEMANTIC_CACHE_PATH", "semantic_cache.npz")
+rag_backend = os.getenv("RAG_BACKEND", "chroma")
+sqlite_vec_db_path = os.getenv("SQLITE_VEC_DB_PATH", "rag.sqlite3")
 
-from src.components.rag_pipeline import RAGPipeline, RAGPipelineError
+from src.components.rag_pipeline import RAGPipeline, RAGPipelineError, SqliteVecRAGPipeline
 from src.components.llm_client import LLMClient, LLMError
 from src.utils.document_processor import DocumentProcessor
-from src.config.settings import DeploymentConfig
+from src.utils.embedding_cache import text_key
+from src.utils.semantic_cache import SemanticCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,25 +54,112 @@ This system allows you to query internal financial documents using natural langu
 Upload your documents and ask questions about their contents.
 """)
 
+# Heavy components are created once per process and shared across reruns and sessions
+@st.cache_resource
+def get_rag():
+    """Create the RAG pipeline for the configured backend."""
+    if rag_backend == "chroma":
+        return RAGPipeline(
+            persist_directory=chroma_db_dir,
+            embedding_cache_dir=embedding_cache_dir
+        )
+    if rag_backend == "sqlite-vec":
+        return SqliteVecRAGPipeline(
+            db_path=sqlite_vec_db_path,
+            embedding_cache_dir=embedding_cache_dir
+        )
+    raise ValueError(f"Unsupported RAG_BACKEND: {rag_backend}. Use 'chroma' or 'sqlite-vec'.")
+
+@st.cache_resource
+def get_llm():
+    """Create the LLM client and log the active deployment."""
+    client = LLMClient()
+    logger.info(f"Initialized with model: {client.config['model_name']}")
+    logger.info(f"Using base URL: {client.config['base_url']}")
+    return client
+
+@st.cache_resource
+def get_processor():
+    """Create the document processor."""
+    # The text cache stays off: uploads are parsed once per session from fresh temp paths, so it would never hit
+    return DocumentProcessor(cache_text=False)
+
+@st.cache_resource
+def get_semantic_cache():
+    """Load the semantic response cache."""
+    return SemanticCache(path=semantic_cache_path)
+
 # Initialize components
 try:
-    rag_pipeline = RAGPipeline(persist_directory=chroma_db_dir)
-    llm_client = LLMClient()
-    document_processor = DocumentProcessor()
-    
-    # Log initialization
-    config = DeploymentConfig.get_active_config()
-    logger.info(f"Initialized with model: {config['model_name']}")
-    logger.info(f"Using base URL: {config['base_url']}")
+    rag_pipeline = get_rag()
+    llm_client = get_llm()
+    document_processor = get_processor()
+    semantic_cache = get_semantic_cache()
     
 except Exception as e:
     st.error(f"❌ Failed to initialize components: {str(e)}")
     st.stop()
 
+@st.cache_resource
+def get_ingest_executor():
+    """Create the thread pool that indexes uploads in the background for all sessions."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="ingest")
+
+# Uploads are copied to disk in blocks of this size instead of as one bytes object
+UPLOAD_COPY_BUFFER = 1024 * 1024
+
+def save_upload(file) -> Path:
+    """Stream an uploaded file to a private temp file and return its path."""
+    file.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=Path(file.name).suffix, delete=False) as f:
+        try:
+            shutil.copyfileobj(file, f, length=UPLOAD_COPY_BUFFER)
+        except BaseException:
+            f.close()
+            Path(f.name).unlink()
+            raise
+        return Path(f.name)
+
+# Chunks added to the vector store between two progress updates
+INGEST_STEP = 64
+
+def ingest(chunks: list, metadatas: list, progress: queue.Queue) -> None:
+    """Add chunks to the vector store, putting ("progress", done, total) on the queue after each step."""
+    total = len(chunks)
+    for start in range(0, total, INGEST_STEP):
+        rag_pipeline.add_documents(chunks[start:start + INGEST_STEP], metadatas[start:start + INGEST_STEP])
+        progress.put(("progress", min(start + INGEST_STEP, total), total))
+    rag_pipeline.flush()
+
+def wait_for_ingest() -> None:
+    """
+    Show the progress of this session's background ingestion until it finishes, then re-raise its error, if any.
+    The ingested uploads are only marked as indexed once the job succeeded, so failed ones are retried.
+    """
+    # The job stays in the session until its result is read, so a rerun that
+    # interrupts the progress loop below picks it up again
+    pending = st.session_state.get("ingest")
+    if pending is None:
+        return
+    future, progress, file_ids = pending
+    bar = st.progress(0.0, text="Indexing uploaded documents...")
+    while not (future.done() and progress.empty()):
+        try:
+            _, done, total = progress.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        bar.progress(done / total, text=f"Indexed {done}/{total} chunks")
+    bar.empty()
+    try:
+        future.result()
+    finally:
+        del st.session_state["ingest"]
+    st.session_state.setdefault("indexed_uploads", set()).update(file_ids)
+
 # File uploader for PDF/DOCX files
 uploaded_files = st.file_uploader(
     "Upload your documents (PDF/DOCX)",
-    type=['pdf', 'docx'],
+    type=sorted(suffix.lstrip('.') for suffix in DocumentProcessor.SUPPORTED_FORMATS),
     accept_multiple_files=True
 )
 
@@ -84,47 +180,86 @@ if query:
         with st.spinner("Processing your query..."):
             try:
                 # 1. Process uploaded documents and add to vector store
-                uploaded_chunks = []
-                for file in uploaded_files:
-                    temp_path = Path("temp") / file.name
-                    temp_path.parent.mkdir(exist_ok=True)
-                    with open(temp_path, "wb") as f:
-                        f.write(file.getvalue())
-                    chunks = document_processor.process_document(temp_path)
-                    rag_pipeline.add_documents(chunks, [{"source": file.name} for _ in chunks])
-                    uploaded_chunks.extend(chunks)
-                    temp_path.unlink()
+                #    Chunks are kept per upload in the session, so reruns only parse new files.
+                #    Results keep upload order; small batches parse PDFs one at a time (see process_documents).
+                parsed = st.session_state.setdefault("parsed_uploads", {})
+                indexed = st.session_state.setdefault("indexed_uploads", set())
+                new_files = [file for file in uploaded_files if file.file_id not in parsed]
+                if new_files:
+                    temp_paths = []
+                    try:
+                        for file in new_files:
+                            temp_paths.append(save_upload(file))
+                        for file, chunks in zip(new_files, document_processor.process_documents(temp_paths)):
+                            parsed[file.file_id] = chunks
+                    finally:
+                        for temp_path in temp_paths:
+                            temp_path.unlink()
+                
+                # Forget files that were removed from the uploader
+                current_ids = {file.file_id for file in uploaded_files}
+                for file_id in list(parsed):
+                    if file_id not in current_ids:
+                        del parsed[file_id]
+                indexed.intersection_update(current_ids)
+                
+                uploaded_chunks = [chunk for file in uploaded_files for chunk in parsed[file.file_id]]
+                
+                # Embed and store uploads that are not indexed yet in the background; they are already
+                #    part of the context. The job is kept in the session so a rerun that interrupts this
+                #    one still reports it, and a failed job is retried on the next query.
+                wait_for_ingest()
+                unindexed = [file for file in uploaded_files if file.file_id not in indexed]
+                if unindexed:
+                    new_chunks = [chunk for file in unindexed for chunk in parsed[file.file_id]]
+                    new_metadatas = [{"source": file.name} for file in unindexed for _ in parsed[file.file_id]]
+                    progress = queue.Queue()
+                    future = get_ingest_executor().submit(ingest, new_chunks, new_metadatas, progress)
+                    st.session_state["ingest"] = (future, progress, [file.file_id for file in unindexed])
 
                 # 2. Query the vector store for relevant context (global search)
                 relevant_docs = rag_pipeline.query(query)
 
                 # 3. Hybrid context: always include uploaded chunks, plus global search results (no duplicates)
                 context = []
-                seen_contents = set()
+                seen = set()
                 
                 # Add all uploaded chunks first
                 for chunk in uploaded_chunks:
-                    if chunk not in seen_contents:
+                    if chunk not in seen:
                         context.append(chunk)
-                        seen_contents.add(chunk)
+                        seen.add(chunk)
                 
                 # Add top global results (excluding duplicates)
                 for doc in relevant_docs:
-                    if doc.page_content not in seen_contents:
+                    if doc.page_content not in seen:
                         context.append(doc.page_content)
-                        seen_contents.add(doc.page_content)
+                        seen.add(doc.page_content)
 
                 # 4. Allow context to be empty (for debugging Ollama connection)
                 if not context:
                     st.info("No relevant context found. Sending only your question to the LLM.")
 
-                # 5. Generate response using LLM (RunPod/Ollama)
-                response = llm_client.generate_response(
-                    prompt=query,
-                    context=context if context else None
-                )
-                st.success("✅ Response generated successfully")
-                st.write("Response:", response["text"])
+                # 5. Reuse a cached answer for near-duplicate questions over the same context
+                context_key = text_key("\n\n".join(context))
+                query_embedding = rag_pipeline.embeddings.embed_query(query)
+                cached_text = semantic_cache.lookup(query_embedding, namespace=context_key)
+
+                if cached_text is not None:
+                    st.success("✅ Response served from cache")
+                    st.write("Response:", cached_text)
+                else:
+                    # 6. Stream the response from the LLM (RunPod/Ollama) as it is generated
+                    st.write("Response:")
+                    response_text = st.write_stream(llm_client.stream_response(
+                        prompt=query,
+                        context=context if context else None
+                    ))
+                    semantic_cache.insert(query_embedding, response_text, namespace=context_key)
+                    st.success("✅ Response generated successfully")
+
+                # Show indexing progress and surface any error from the background ingestion
+                wait_for_ingest()
 
             except (RAGPipelineError, LLMError) as e:
                 st.error(f"❌ Error: {e}")
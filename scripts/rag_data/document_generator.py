@@ -6,9 +6,86 @@ will search through when answering queries.
 
 from fpdf import FPDF
 from datetime import datetime, timedelta
+from typing import Optional
 import os
-import random
 import uuid
+import numpy as np
+
+# Sample customer companies (lessees) for variety
+LESSEES = (
+    "Tech Solutions AB",
+    "Nordic Manufacturing Ltd",
+    "Green Energy Systems",
+    "Healthcare Innovations",
+    "Construction Partners",
+    "Retail Solutions Group",
+    "Logistics Experts",
+    "Food Processing Co",
+    "Educational Services",
+    "Research & Development Corp"
+)
+
+# Sample equipment types
+EQUIPMENT_TYPES = (
+    "Office Equipment",
+    "Manufacturing Machinery",
+    "IT Infrastructure",
+    "Medical Equipment",
+    "Construction Equipment",
+    "Energy Systems",
+    "Logistics Equipment",
+    "Food Processing Machinery",
+    "Educational Technology",
+    "Research Equipment"
+)
+
+# Possible lease durations in months
+LEASE_TERMS = (24, 36, 48)
+
+# Possible net payment terms in days
+NET_PAYMENT_DAYS = (15, 30, 45)
+
+# Leasing agreement terms; placeholders are filled per document
+TERMS_TEMPLATE = "\n".join((
+    "1. LEASE TERM: {lease_term} months from the commencement date.",
+    "2. MONTHLY PAYMENT: EUR {monthly_payment:,.2f}, due on the first day of each month.",
+    "3. EQUIPMENT: {equipment} as specified in Schedule A.",
+    "4. INSURANCE: Lessee shall maintain comprehensive insurance coverage.",
+    "5. MAINTENANCE: Lessee responsible for routine maintenance.",
+    "6. EARLY TERMINATION: 3 months' notice required with early termination fee.",
+    "7. RENEWAL: Option to renew for additional 12 months at market rate.",
+    "8. DEFAULT: Late payment fee of 5% after 5 business days.",
+    "9. WARRANTIES: Equipment provided 'as is' with standard manufacturer warranty.",
+    "10. CONFIDENTIALITY: Both parties agree to maintain confidentiality."
+))
+
+# Credit policy sections as (title, body template) pairs
+CREDIT_POLICY_SECTIONS = (
+    ("CREDIT ASSESSMENT", "\n".join((
+        "1. All new customers must complete a credit application form.",
+        "2. Credit checks will be performed through approved agencies.",
+        "3. Minimum credit score requirement: {min_credit_score}.",
+        "4. Trade references required for amounts over EUR {trade_reference_amount:,}."
+    ))),
+    ("CREDIT LIMITS", "\n".join((
+        "1. Standard credit limit: EUR {standard_credit_limit:,} for new customers.",
+        "2. Increased limits require senior management approval.",
+        "3. Maximum credit limit: EUR {max_credit_limit:,}.",
+        "4. Regular review of credit limits every 6 months."
+    ))),
+    ("PAYMENT TERMS", "\n".join((
+        "1. Standard payment terms: Net {net_days} days.",
+        "2. Early payment discount: {early_discount}% if paid within 10 days.",
+        "3. Late payment fee: {late_fee:.1f}% per month.",
+        "4. Payment methods: Bank transfer, credit card, check."
+    ))),
+    ("COLLECTION PROCEDURES", "\n".join((
+        "1. First reminder: {first_reminder} days after due date.",
+        "2. Second reminder: {second_reminder} days after due date.",
+        "3. Final notice: {final_notice} days after due date.",
+        "4. Legal action: After {legal_action} days of non-payment."
+    )))
+)
 
 class HistoricalDocumentGenerator:
     """
@@ -17,59 +94,32 @@ class HistoricalDocumentGenerator:
     that represent the historical policies and agreements in the system.
     """
     
-    def __init__(self, output_dir: str = "data/rag_documents"):
+    def __init__(self, output_dir: str = "data/rag_documents", seed: Optional[int] = None):
         """
         Initialize the document generator.
         
         Args:
             output_dir (str): Directory where historical documents will be saved
+            seed (Optional[int]): Seed for the random generator. Defaults to None (fresh OS entropy).
         """
         self.output_dir = output_dir
+        self._rng = np.random.default_rng(seed)
         os.makedirs(output_dir, exist_ok=True)
         
         # Our company (consistent lessor)
         self.lessor = "Financial Services Corp."
         
-        # Sample customer companies (lessees) for variety
-        self.lessees = [
-            "Tech Solutions AB",
-            "Nordic Manufacturing Ltd",
-            "Green Energy Systems",
-            "Healthcare Innovations",
-            "Construction Partners",
-            "Retail Solutions Group",
-            "Logistics Experts",
-            "Food Processing Co",
-            "Educational Services",
-            "Research & Development Corp"
-        ]
-        
-        # Sample equipment types
-        self.equipment_types = [
-            "Office Equipment",
-            "Manufacturing Machinery",
-            "IT Infrastructure",
-            "Medical Equipment",
-            "Construction Equipment",
-            "Energy Systems",
-            "Logistics Equipment",
-            "Food Processing Machinery",
-            "Educational Technology",
-            "Research Equipment"
-        ]
-        
-        # Keep track of used dates to ensure uniqueness
-        self.used_dates = set()
-        
-    def _get_unique_date(self, base_date, max_days=730):
+        self.lessees = LESSEES
+        self.equipment_types = EQUIPMENT_TYPES
+        
+        # Day offsets drawn without replacement so every generated date is unique
+        self._date_pool = self._rng.permutation(731).tolist()
+        
+    def _get_unique_date(self, base_date):
         """Generate a unique date that hasn't been used before."""
-        while True:
-            days_ago = random.randint(0, max_days)
-            date = base_date + timedelta(days=days_ago)
-            date_str = date.strftime('%Y%m%d')
-            if date_str not in self.used_dates:
-                self.used_dates.add(date_str)
-                return date
+        if not self._date_pool:
+            raise RuntimeError("No unique dates left: all 731 day offsets have been used")
+        return base_date + timedelta(days=self._date_pool.pop())
         
     def create_leasing_agreement(self, agreement_date: datetime = None, lessee: str = None, 
                                equipment: str = None, monthly_payment: float = None):
@@ -86,14 +136,20 @@ class HistoricalDocumentGenerator:
             agreement_date = datetime.now() - timedelta(days=730)
             agreement_date = self._get_unique_date(agreement_date)
             
+        # Draw every random value of the document in a single call
+        lessee_idx, equipment_idx, payment, agreement_no, term_idx = self._rng.integers(
+            [0, 0, 1000, 1, 0],
+            [len(self.lessees), len(self.equipment_types), 5001, 1000, len(LEASE_TERMS)]
+        ).tolist()
+        
         if lessee is None:
-            lessee = random.choice(self.lessees)
+            lessee = self.lessees[lessee_idx]
             
         if equipment is None:
-            equipment = random.choice(self.equipment_types)
+            equipment = self.equipment_types[equipment_idx]
             
         if monthly_payment is None:
-            monthly_payment = random.randint(1000, 5000)
+            monthly_payment = payment
             
         unique_id = uuid.uuid4().hex[:6]
         filename = f"historical_leasing_agreement_{agreement_date.strftime('%Y%m%d')}_{unique_id}.pdf"
@@ -108,7 +164,7 @@ class HistoricalDocumentGenerator:
         # Agreement Details
         pdf.set_font('Arial', '', 12)
         pdf.cell(0, 10, f'Agreement Date: {agreement_date.strftime("%Y-%m-%d")}', 0, 1)
-        pdf.cell(0, 10, f'Agreement Number: LEA-{agreement_date.strftime("%Y%m")}-{random.randint(1, 999):03d}', 0, 1)
+        pdf.cell(0, 10, f'Agreement Number: LEA-{agreement_date.strftime("%Y%m")}-{agreement_no:03d}', 0, 1)
         pdf.ln(5)
         
         # Parties
@@ -124,22 +180,11 @@ class HistoricalDocumentGenerator:
         pdf.cell(0, 10, 'TERMS AND CONDITIONS', 0, 1)
         pdf.set_font('Arial', '', 12)
         
-        terms = [
-            f"1. LEASE TERM: {random.choice([24, 36, 48])} months from the commencement date.",
-            f"2. MONTHLY PAYMENT: EUR {monthly_payment:,.2f}, due on the first day of each month.",
-            f"3. EQUIPMENT: {equipment} as specified in Schedule A.",
-            "4. INSURANCE: Lessee shall maintain comprehensive insurance coverage.",
-            "5. MAINTENANCE: Lessee responsible for routine maintenance.",
-            "6. EARLY TERMINATION: 3 months' notice required with early termination fee.",
-            "7. RENEWAL: Option to renew for additional 12 months at market rate.",
-            "8. DEFAULT: Late payment fee of 5% after 5 business days.",
-            "9. WARRANTIES: Equipment provided 'as is' with standard manufacturer warranty.",
-            "10. CONFIDENTIALITY: Both parties agree to maintain confidentiality."
-        ]
-        
-        for term in terms:
-            pdf.multi_cell(0, 10, term)
-            pdf.ln(2)
+        pdf.multi_cell(0, 10, TERMS_TEMPLATE.format(
+            lease_term=LEASE_TERMS[term_idx],
+            monthly_payment=monthly_payment,
+            equipment=equipment
+        ))
         
         # Save the PDF
         pdf.output(os.path.join(self.output_dir, filename))
@@ -156,6 +201,14 @@ class HistoricalDocumentGenerator:
             effective_date = datetime.now() - timedelta(days=730)
             effective_date = self._get_unique_date(effective_date)
             
+        # Draw every random value of the document in a single call
+        (policy_no, min_credit_score, trade_reference_amount, standard_credit_limit,
+         max_credit_limit, net_days_idx, early_discount, first_reminder, second_reminder,
+         final_notice, legal_action) = self._rng.integers(
+            [1, 600, 30000, 20000, 400000, 0, 1, 3, 10, 25, 45],
+            [1000, 701, 70001, 30001, 600001, len(NET_PAYMENT_DAYS), 4, 8, 21, 36, 76]
+        ).tolist()
+            
         unique_id = uuid.uuid4().hex[:6]
         filename = f"historical_credit_policy_{effective_date.strftime('%Y%m%d')}_{unique_id}.pdf"
         pdf = FPDF()
@@ -169,45 +222,30 @@ class HistoricalDocumentGenerator:
         # Policy Details
         pdf.set_font('Arial', '', 12)
         pdf.cell(0, 10, f'Effective Date: {effective_date.strftime("%Y-%m-%d")}', 0, 1)
-        pdf.cell(0, 10, f'Policy Number: CP-{effective_date.strftime("%Y%m")}-{random.randint(1, 999):03d}', 0, 1)
+        pdf.cell(0, 10, f'Policy Number: CP-{effective_date.strftime("%Y%m")}-{policy_no:03d}', 0, 1)
         pdf.cell(0, 10, f'Issuing Company: {self.lessor}', 0, 1)
         pdf.ln(5)
         
         # Policy Sections
-        sections = [
-            ("CREDIT ASSESSMENT", [
-                "1. All new customers must complete a credit application form.",
-                "2. Credit checks will be performed through approved agencies.",
-                f"3. Minimum credit score requirement: {random.randint(600, 700)}.",
-                f"4. Trade references required for amounts over EUR {random.randint(30000, 70000):,}."
-            ]),
-            ("CREDIT LIMITS", [
-                f"1. Standard credit limit: EUR {random.randint(20000, 30000):,} for new customers.",
-                "2. Increased limits require senior management approval.",
-                f"3. Maximum credit limit: EUR {random.randint(400000, 600000):,}.",
-                "4. Regular review of credit limits every 6 months."
-            ]),
-            ("PAYMENT TERMS", [
-                f"1. Standard payment terms: Net {random.choice([15, 30, 45])} days.",
-                f"2. Early payment discount: {random.randint(1, 3)}% if paid within 10 days.",
-                f"3. Late payment fee: {random.uniform(1.0, 2.0):.1f}% per month.",
-                "4. Payment methods: Bank transfer, credit card, check."
-            ]),
-            ("COLLECTION PROCEDURES", [
-                f"1. First reminder: {random.randint(3, 7)} days after due date.",
-                f"2. Second reminder: {random.randint(10, 20)} days after due date.",
-                f"3. Final notice: {random.randint(25, 35)} days after due date.",
-                f"4. Legal action: After {random.randint(45, 75)} days of non-payment."
-            ])
-        ]
-        
-        for section_title, items in sections:
+        values = {
+            "min_credit_score": min_credit_score,
+            "trade_reference_amount": trade_reference_amount,
+            "standard_credit_limit": standard_credit_limit,
+            "max_credit_limit": max_credit_limit,
+            "net_days": NET_PAYMENT_DAYS[net_days_idx],
+            "early_discount": early_discount,
+            "late_fee": self._rng.uniform(1.0, 2.0),
+            "first_reminder": first_reminder,
+            "second_reminder": second_reminder,
+            "final_notice": final_notice,
+            "legal_action": legal_action
+        }
+        
+        for section_title, body in CREDIT_POLICY_SECTIONS:
             pdf.set_font('Arial', 'B', 12)
             pdf.cell(0, 10, section_title, 0, 1)
             pdf.set_font('Arial', '', 12)
-            for item in items:
-                pdf.multi_cell(0, 10, item)
-                pdf.ln(2)
+            pdf.multi_cell(0, 10, body.format(**values))
             pdf.ln(5)
         
         # Save the PDF
@@ -6,6 +6,8 @@ will search through when answering queries.
 
 import os
 import sys
+from datetime import datetime, timedelta
+from multiprocessing import Pool
 from pathlib import Path
 
 # Add the scripts directory to the Python path
@@ -15,6 +17,29 @@ if scripts_dir not in sys.path:
 
 from rag_data.document_generator import HistoricalDocumentGenerator
 
+# Per-process generator, created once by the pool initializer
+_worker_generator = None
+
+def _init_worker(output_dir):
+    """Create the generator used by a pool worker."""
+    global _worker_generator
+    # Each generator seeds its own RNG from OS entropy, so forked workers never repeat documents
+    _worker_generator = HistoricalDocumentGenerator(output_dir=output_dir)
+
+def _generate_leasing_agreement(agreement_date):
+    """Generate one leasing agreement in a pool worker."""
+    try:
+        return _worker_generator.create_leasing_agreement(agreement_date=agreement_date), None
+    except Exception as e:
+        return None, str(e)
+
+def _generate_credit_policy(effective_date):
+    """Generate one credit policy in a pool worker."""
+    try:
+        return _worker_generator.create_credit_policy(effective_date=effective_date), None
+    except Exception as e:
+        return None, str(e)
+
 def main():
     """Generate historical documents for the RAG system."""
     # Define output directory
@@ -35,25 +60,29 @@ def main():
     print("\nGenerating historical documents...")
     generated_files = []
     
-    # Generate historical leasing agreements (from past 2 years)
-    print("\nGenerating historical leasing agreements...")
-    for i in range(20):
-        try:
-            filename = generator.create_leasing_agreement()
+    # Draw all dates up front so they stay unique across worker processes
+    base_date = datetime.now() - timedelta(days=730)
+    agreement_dates = [generator._get_unique_date(base_date) for _ in range(20)]
+    policy_dates = [generator._get_unique_date(base_date) for _ in range(10)]
+    
+    with Pool(initializer=_init_worker, initargs=(output_dir,)) as pool:
+        # Generate historical leasing agreements (from past 2 years)
+        print("\nGenerating historical leasing agreements...")
+        for filename, error in pool.map(_generate_leasing_agreement, agreement_dates):
+            if error:
+                print(f"Error generating leasing agreement: {error}")
+                continue
             generated_files.append(filename)
             print(f"Generated historical leasing agreement: {filename}")
-        except Exception as e:
-            print(f"Error generating leasing agreement: {e}")
-    
-    # Generate historical credit policies
-    print("\nGenerating historical credit policies...")
-    for i in range(10):
-        try:
-            filename = generator.create_credit_policy()
+        
+        # Generate historical credit policies
+        print("\nGenerating historical credit policies...")
+        for filename, error in pool.map(_generate_credit_policy, policy_dates):
+            if error:
+                print(f"Error generating credit policy: {error}")
+                continue
             generated_files.append(filename)
             print(f"Generated historical credit policy: {filename}")
-        except Exception as e:
-            print(f"Error generating credit policy: {e}")
     
     # Print summary
     print("\nHistorical Document Generation Summary:")
@@ -7,57 +7,142 @@ to compare against historical documents in the RAG system's knowledge base.
 import os
 from fpdf import FPDF
 from docx import Document
-import random
 from datetime import datetime, timedelta
 import uuid
+import numpy as np
+
+_rng = np.random.default_rng()
+
+_COMPANIES = (
+    "AcmeCorp", "BetaFinance", "DeltaTech", "EpsilonSolutions", 
+    "GammaInnovations", "OmegaSystems", "SigmaEnterprises"
+)
+
+_EQUIPMENT_TYPES = (
+    "Office Equipment",
+    "Manufacturing Machinery",
+    "IT Infrastructure",
+    "Medical Equipment",
+    "Construction Equipment",
+    "Energy Systems",
+    "Logistics Equipment",
+    "Food Processing Machinery",
+    "Educational Technology",
+    "Research Equipment"
+)
+
+_LEASE_TERMS = (24, 36, 48)
+
+_POLICY_TYPES = (
+    "Credit Assessment",
+    "Payment Terms",
+    "Collection Procedures",
+    "Risk Management",
+    "Customer Onboarding"
+)
+
+_CONTRACT_TERMS_TEMPLATE = "\n".join((
+    "1. LEASE TERM: {lease_term} months from the commencement date.",
+    "2. MONTHLY PAYMENT: EUR {monthly_payment:,.2f}, due on the first day of each month.",
+    "3. EQUIPMENT: {equipment} as specified in Schedule A.",
+    "4. INSURANCE: Lessee shall maintain comprehensive insurance coverage.",
+    "5. MAINTENANCE: Lessee responsible for routine maintenance.",
+    "6. EARLY TERMINATION: 3 months' notice required with early termination fee.",
+    "7. RENEWAL: Option to renew for additional 12 months at market rate.",
+    "8. DEFAULT: Late payment fee of 5% after 5 business days.",
+    "9. WARRANTIES: Equipment provided 'as is' with standard manufacturer warranty.",
+    "10. CONFIDENTIALITY: Both parties agree to maintain confidentiality."
+))
+
+_CREDIT_POLICY_CONTENT = (
+    "1. CREDIT SCORE REQUIREMENTS",
+    "   - Minimum credit score: 650",
+    "   - No recent bankruptcies",
+    "   - Clean payment history",
+    "",
+    "2. FINANCIAL ASSESSMENT",
+    "   - Minimum annual revenue: EUR 500,000",
+    "   - Positive cash flow for last 12 months",
+    "   - Acceptable debt-to-income ratio",
+    "",
+    "3. DOCUMENTATION REQUIREMENTS",
+    "   - Financial statements",
+    "   - Tax returns",
+    "   - Bank statements"
+)
+
+_PAYMENT_TERMS_CONTENT = (
+    "1. STANDARD PAYMENT TERMS",
+    "   - Net 30 for standard customers",
+    "   - Net 15 for preferred customers",
+    "   - Net 45 for large enterprise customers",
+    "",
+    "2. LATE PAYMENT PROCEDURES",
+    "   - 5% late fee after 5 days",
+    "   - Account review after 30 days",
+    "   - Collection process after 60 days",
+    "",
+    "3. PAYMENT METHODS",
+    "   - Bank transfer",
+    "   - Credit card (2% fee)",
+    "   - Direct debit"
+)
+
+_GENERAL_POLICY_CONTENT = (
+    "1. POLICY OBJECTIVES",
+    "   - Ensure consistent application",
+    "   - Maintain compliance",
+    "   - Protect company interests",
+    "",
+    "2. IMPLEMENTATION GUIDELINES",
+    "   - Regular review and updates",
+    "   - Staff training requirements",
+    "   - Documentation standards",
+    "",
+    "3. COMPLIANCE REQUIREMENTS",
+    "   - Regular audits",
+    "   - Reporting procedures",
+    "   - Record keeping"
+)
+
+_POLICY_CONTENT = {
+    "Credit Assessment": _CREDIT_POLICY_CONTENT,
+    "Payment Terms": _PAYMENT_TERMS_CONTENT
+}
 
 def generate_contract_data():
     """Generate realistic current contract data for test queries."""
-    companies = [
-        "AcmeCorp", "BetaFinance", "DeltaTech", "EpsilonSolutions", 
-        "GammaInnovations", "OmegaSystems", "SigmaEnterprises"
-    ]
-    
-    equipment_types = [
-        "Office Equipment",
-        "Manufacturing Machinery",
-        "IT Infrastructure",
-        "Medical Equipment",
-        "Construction Equipment",
-        "Energy Systems",
-        "Logistics Equipment",
-        "Food Processing Machinery",
-        "Educational Technology",
-        "Research Equipment"
-    ]
+    # Draw every random value in a single call
+    company_idx, equipment_idx, term_idx, monthly_payment, agreement_no = _rng.integers(
+        [0, 0, 0, 1000, 1],
+        [len(_COMPANIES), len(_EQUIPMENT_TYPES), len(_LEASE_TERMS), 5001, 1000]
+    ).tolist()
     
     # Generate data with current date
     data = {
-        "company": random.choice(companies),
+        "company": _COMPANIES[company_idx],
         "date": datetime.now().strftime("%Y-%m-%d"),
-        "equipment": random.choice(equipment_types),
-        "lease_term": random.choice([24, 36, 48]),
-        "monthly_payment": random.randint(1000, 5000),
-        "agreement_number": f"LEA-{datetime.now().strftime('%Y%m')}-{random.randint(1, 999):03d}"
+        "equipment": _EQUIPMENT_TYPES[equipment_idx],
+        "lease_term": _LEASE_TERMS[term_idx],
+        "monthly_payment": monthly_payment,
+        "agreement_number": f"LEA-{datetime.now().strftime('%Y%m')}-{agreement_no:03d}"
     }
     return data
 
 def generate_policy_data():
     """Generate realistic current policy data for test queries."""
-    policy_types = [
-        "Credit Assessment",
-        "Payment Terms",
-        "Collection Procedures",
-        "Risk Management",
-        "Customer Onboarding"
-    ]
+    # Draw every random value in a single call
+    policy_idx, major, minor, policy_no = _rng.integers(
+        [0, 1, 0, 1],
+        [len(_POLICY_TYPES), 6, 10, 1000]
+    ).tolist()
     
     # Generate data with current date
     data = {
-        "policy_type": random.choice(policy_types),
+        "policy_type": _POLICY_TYPES[policy_idx],
         "effective_date": datetime.now().strftime("%Y-%m-%d"),
-        "version": f"v{random.randint(1, 5)}.{random.randint(0, 9)}",
-        "policy_number": f"POL-{datetime.now().strftime('%Y%m')}-{random.randint(1, 999):03d}"
+        "version": f"v{major}.{minor}",
+        "policy_number": f"POL-{datetime.now().strftime('%Y%m')}-{policy_no:03d}"
     }
     return data
 
@@ -90,22 +175,11 @@ def create_contract_pdf(data):
     pdf.cell(0, 10, 'TERMS AND CONDITIONS', ln=True)
     pdf.set_font('Arial', '', 12)
     
-    terms = [
-        f"1. LEASE TERM: {data['lease_term']} months from the commencement date.",
-        f"2. MONTHLY PAYMENT: EUR {data['monthly_payment']:,.2f}, due on the first day of each month.",
-        f"3. EQUIPMENT: {data['equipment']} as specified in Schedule A.",
-        "4. INSURANCE: Lessee shall maintain comprehensive insurance coverage.",
-        "5. MAINTENANCE: Lessee responsible for routine maintenance.",
-        "6. EARLY TERMINATION: 3 months' notice required with early termination fee.",
-        "7. RENEWAL: Option to renew for additional 12 months at market rate.",
-        "8. DEFAULT: Late payment fee of 5% after 5 business days.",
-        "9. WARRANTIES: Equipment provided 'as is' with standard manufacturer warranty.",
-        "10. CONFIDENTIALITY: Both parties agree to maintain confidentiality."
-    ]
-    
-    for term in terms:
-        pdf.multi_cell(0, 10, term)
-        pdf.ln(2)
+    pdf.multi_cell(0, 10, _CONTRACT_TERMS_TEMPLATE.format(
+        lease_term=data["lease_term"],
+        monthly_payment=data["monthly_payment"],
+        equipment=data["equipment"]
+    ))
     
     # Save the PDF
     os.makedirs('data/test_documents', exist_ok=True)
@@ -135,58 +209,8 @@ def create_policy_pdf(data):
     pdf.cell(0, 10, 'POLICY CONTENT', ln=True)
     pdf.set_font('Arial', '', 12)
     
-    # Generate policy-specific content
-    if data["policy_type"] == "Credit Assessment":
-        content = [
-            "1. CREDIT SCORE REQUIREMENTS",
-            "   - Minimum credit score: 650",
-            "   - No recent bankruptcies",
-            "   - Clean payment history",
-            "",
-            "2. FINANCIAL ASSESSMENT",
-            "   - Minimum annual revenue: EUR 500,000",
-            "   - Positive cash flow for last 12 months",
-            "   - Acceptable debt-to-income ratio",
-            "",
-            "3. DOCUMENTATION REQUIREMENTS",
-            "   - Financial statements",
-            "   - Tax returns",
-            "   - Bank statements"
-        ]
-    elif data["policy_type"] == "Payment Terms":
-        content = [
-            "1. STANDARD PAYMENT TERMS",
-            "   - Net 30 for standard customers",
-            "   - Net 15 for preferred customers",
-            "   - Net 45 for large enterprise customers",
-            "",
-            "2. LATE PAYMENT PROCEDURES",
-            "   - 5% late fee after 5 days",
-            "   - Account review after 30 days",
-            "   - Collection process after 60 days",
-            "",
-            "3. PAYMENT METHODS",
-            "   - Bank transfer",
-            "   - Credit card (2% fee)",
-            "   - Direct debit"
-        ]
-    else:
-        content = [
-            "1. POLICY OBJECTIVES",
-            "   - Ensure consistent application",
-            "   - Maintain compliance",
-            "   - Protect company interests",
-            "",
-            "2. IMPLEMENTATION GUIDELINES",
-            "   - Regular review and updates",
-            "   - Staff training requirements",
-            "   - Documentation standards",
-            "",
-            "3. COMPLIANCE REQUIREMENTS",
-            "   - Regular audits",
-            "   - Reporting procedures",
-            "   - Record keeping"
-        ]
+    # Pick the policy-specific content
+    content = _POLICY_CONTENT.get(data["policy_type"], _GENERAL_POLICY_CONTENT)
     
     for line in content:
         pdf.multi_cell(0, 10, line)
@@ -1,9 +1,11 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from dotenv import load_dotenv
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src directory to Python path
@@ -13,6 +15,11 @@ if src_path not in sys.path:
 
 from src.config.settings import DeploymentConfig
 
+# Shared session so all probes reuse one keep-alive connection pool
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=16))
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=16))
+
 def test_ollama_connection(base_url):
     """Test basic Ollama connectivity and model availability."""
     print(f"\n=== Testing Ollama at {base_url} ===")
@@ -22,26 +29,36 @@ def test_ollama_connection(base_url):
     model_name = config["model_name"]
     print(f"Using model: {model_name}")
     
-    # 1. Test basic connectivity
-    try:
-        print("\n1. Testing basic connectivity...")
-        response = requests.get(f"{base_url}/api/tags")
-        response.raise_for_status()
-        print("✅ Basic connectivity successful")
-    except Exception as e:
-        print(f"❌ Basic connectivity failed: {str(e)}")
-        return False
+    # 1. Test basic connectivity (tags and version are probed concurrently)
+    print("\n1. Testing basic connectivity...")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tags_future = pool.submit(SESSION.get, f"{base_url}/api/tags")
+        version_future = pool.submit(SESSION.get, f"{base_url}/api/version")
+        try:
+            tags_response = tags_future.result()
+            tags_response.raise_for_status()
+            print("✅ Basic connectivity successful")
+        except Exception as e:
+            print(f"❌ Basic connectivity failed: {str(e)}")
+            return False
+        
+        # The version is informational only, so failing to read it is just a warning
+        try:
+            version_response = version_future.result()
+            version_response.raise_for_status()
+            print(f"Ollama version: {version_response.json().get('version', 'unknown')}")
+        except Exception as e:
+            print(f"⚠️ Could not read Ollama version: {str(e)}")
 
-    # 2. Check available models
+    # 2. Check available models (reusing the tags response from step 1)
     try:
         print("\n2. Checking available models...")
-        response = requests.get(f"{base_url}/api/tags")
-        models = response.json()
+        models = tags_response.json()
         print(f"Available models: {json.dumps(models, indent=2)}")
         
         if not models.get("models"):
             print(f"No models found. Pulling {model_name}...")
-            pull_response = requests.post(
+            pull_response = SESSION.post(
                 f"{base_url}/api/pull",
                 json={"name": model_name, "insecure": True}
             )
@@ -60,7 +77,7 @@ def test_ollama_connection(base_url):
         prompt = "Say hello in one word."
         print(f"Prompt: {prompt}")
         
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/api/generate",
             json={
                 "model": model_name,
@@ -4,21 +4,72 @@ Provides a consistent interface for LLM operations with robust error handling.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import logging
-from typing import Dict, List, Any, Optional, Union
+import threading
+import time
+from concurrent.futures import Future
+from functools import cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from ..config.settings import DeploymentConfig, DeploymentType
 
+# Seconds an is_available() result is reused before the service is checked again
+AVAILABILITY_TTL = 5.0
+
+# Request bodies are serialized with orjson and sent as raw bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 class LLMError(Exception):
     """Custom exception for LLM-related errors."""
     pass
 
+@cache
+def _active_config() -> Tuple[Dict[str, Any], DeploymentType]:
+    """Look up the deployment configuration once per process."""
+    return DeploymentConfig.get_active_config(), DeploymentConfig._deployment_type
+
 class LLMClient:
     def __init__(self):
-        self.config = DeploymentConfig.get_active_config()
-        self.deployment_type = DeploymentConfig._deployment_type
+        self.config, self.deployment_type = _active_config()
         self.logger = logging.getLogger(__name__)
         
+        # Reuse TCP/TLS connections across requests to the LLM service
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # Endpoints and headers only depend on the configuration, so build them once
+        base_url = self.config['base_url'].rstrip('/')
+        self._is_proxy_url = "proxy.runpod.net" in base_url
+        self._ollama_generate_url = f"{base_url}/api/generate"
+        self._ollama_tags_url = f"{base_url}/api/tags"
+        self._runpod_run_url = f"{self.config['base_url']}/{self.config['endpoint_id']}/run"
+        self._runpod_status_url = f"{self.config['base_url']}/{self.config['endpoint_id']}/status"
+        self._runpod_headers = {
+            "Authorization": f"Bearer {self.config['api_key']}",
+            "Content-Type": "application/json"
+        }
+        
+        # Health probes must fail fast, so their URLs get an adapter without retries
+        probe_adapter = HTTPAdapter(max_retries=0)
+        self._session.mount(self._ollama_tags_url, probe_adapter)
+        self._session.mount(self._runpod_status_url, probe_adapter)
+        
+        # Identical requests already in flight, shared by concurrent callers;
+        # keyed by ("generate" or "stream", prompt, temperature, max_tokens)
+        self._inflight: Dict[Tuple[str, str, float, int], Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Last is_available() result as (monotonic timestamp, available)
+        self._availability: Optional[Tuple[float, bool]] = None
+        
         # Log initialization
         self.logger.info(f"Initializing LLM client with model: {self.config['model_name']}")
         self.logger.info(f"Using base URL: {self.config['base_url']}")
@@ -42,18 +93,144 @@ class LLMClient:
             
         Raises:
             LLMError: If there's an error with the LLM service
+            
+        Note:
+            Concurrent calls with the same prompt and settings are coalesced:
+            only the first one reaches the LLM service and the others wait for its result.
         """
+        full_prompt = self._prepare_prompt(prompt, context)
+        key = ("generate", full_prompt, temperature, max_tokens)
+        future, is_leader = self._join_inflight(key)
+        if not is_leader:
+            self.logger.info("Waiting for identical in-flight request")
+            return dict(future.result())
+        
+        try:
+            result = self._generate(full_prompt, temperature, max_tokens)
+        except BaseException as e:
+            self._fail_inflight(key, future, e)
+            raise
+        self._finish_inflight(key, future, result)
+        return result
+
+    def _join_inflight(self, key: Tuple) -> Tuple[Future, bool]:
+        """Return the future of an identical request in flight, registering a new one if there is none."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _finish_inflight(self, key: Tuple, future: Future, result: Any) -> None:
+        """Hand the leader's result to the waiting callers."""
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.set_result(result)
+
+    def _fail_inflight(self, key: Tuple, future: Future, error: BaseException) -> None:
+        """
+        Hand the leader's error to the waiting callers, so they never block forever.
+        Interrupts such as KeyboardInterrupt or GeneratorExit belong to the leader's thread,
+        so they reach the others as LLMError.
+        """
+        with self._inflight_lock:
+            del self._inflight[key]
+        if isinstance(error, LLMError):
+            future.set_exception(error)
+        else:
+            future.set_exception(LLMError(f"Failed to generate response: {type(error).__name__}"))
+
+    def _generate(self, prompt: str, temperature: float, max_tokens: int) -> Dict[str, Union[str, float]]:
+        """Send a prepared prompt to the configured deployment."""
         try:
-            full_prompt = self._prepare_prompt(prompt, context)
-            
             if self.deployment_type == DeploymentType.RUNPOD:
-                return self._generate_runpod_response(full_prompt, temperature, max_tokens)
-            return self._generate_local_response(full_prompt, temperature, max_tokens)
+                return self._generate_runpod_response(prompt, temperature, max_tokens)
+            return self._generate_local_response(prompt, temperature, max_tokens)
             
         except Exception as e:
             self.logger.error(f"Error generating response: {str(e)}")
             raise LLMError(f"Failed to generate response: {str(e)}")
 
+    def stream_response(self,
+                        prompt: str,
+                        context: Optional[List[str]] = None,
+                        temperature: float = 0.7,
+                        max_tokens: int = 1000) -> Iterator[str]:
+        """
+        Generate a response incrementally, yielding text fragments as they arrive.
+        
+        Args:
+            prompt (str): The user's prompt
+            context (Optional[List[str]]): Additional context for the prompt
+            temperature (float): Controls randomness (0.0 to 1.0)
+            max_tokens (int): Maximum number of tokens to generate
+            
+        Yields:
+            str: Consecutive fragments of the generated text
+            
+        Raises:
+            LLMError: If there's an error with the LLM service
+            
+        Note:
+            RunPod API endpoints do not support streaming; their full response
+            is yielded as a single fragment. Concurrent calls with the same prompt and
+            settings are coalesced: only the first one reaches the LLM service and streams
+            its fragments; the others wait and receive the complete text as one fragment.
+        """
+        full_prompt = self._prepare_prompt(prompt, context)
+        key = ("stream", full_prompt, temperature, max_tokens)
+        future, is_leader = self._join_inflight(key)
+        if not is_leader:
+            self.logger.info("Waiting for identical in-flight request")
+            yield future.result()
+            return
+        
+        fragments = []
+        try:
+            for fragment in self._stream(full_prompt, temperature, max_tokens):
+                fragments.append(fragment)
+                yield fragment
+        except BaseException as e:
+            self._fail_inflight(key, future, e)
+            raise
+        self._finish_inflight(key, future, "".join(fragments))
+
+    def _stream(self, full_prompt: str, temperature: float, max_tokens: int) -> Iterator[str]:
+        """Stream a prepared prompt from the configured deployment."""
+        if self.deployment_type == DeploymentType.RUNPOD and not self._is_proxy_url:
+            yield self._generate_runpod_response(full_prompt, temperature, max_tokens)["text"]
+            return
+        
+        url = self._ollama_generate_url
+        payload = {
+            "model": self.config["model_name"],
+            "prompt": full_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+        
+        try:
+            with self._session.post(url, data=orjson.dumps(payload), headers=JSON_HEADERS, stream=True, timeout=self.config["timeout"]) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if "error" in chunk:
+                        raise LLMError(f"Ollama returned an error: {chunk['error']}")
+                    yield chunk.get("response", "")
+                    if chunk.get("done"):
+                        break
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error streaming from Ollama: {str(e)}")
+            raise LLMError(f"Failed to stream response from Ollama at {url}: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Error parsing Ollama stream: {str(e)}")
+            raise LLMError(f"Invalid streamed response from Ollama: {str(e)}")
+
     def _prepare_prompt(self, prompt: str, context: Optional[List[str]] = None) -> str:
         """Prepare the full prompt by combining context and main prompt."""
         if not context:
@@ -73,7 +250,7 @@ Answer:"""
                                temperature: float = 0.7,
                                max_tokens: int = 1000) -> Dict[str, Union[str, float]]:
         """Generate response using local Ollama instance."""
-        url = f"{self.config['base_url']}/api/generate"
+        url = self._ollama_generate_url
         
         payload = {
             "model": self.config["model_name"],
@@ -84,9 +261,9 @@ Answer:"""
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=self.config["timeout"])
+            response = self._session.post(url, data=orjson.dumps(payload), headers=JSON_HEADERS, timeout=self.config["timeout"])
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             
             return {
                 "text": result.get("response", ""),
@@ -95,7 +272,7 @@ Answer:"""
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error communicating with Ollama: {str(e)}")
             raise LLMError(f"Failed to generate response from local Ollama: {str(e)}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Error parsing Ollama response: {str(e)}")
             raise LLMError(f"Invalid response from Ollama: {str(e)}")
 
@@ -105,23 +282,22 @@ Answer:"""
                                 max_tokens: int = 1000) -> Dict[str, Union[str, float]]:
         """Generate response using RunPod API."""
         # Check if we're using a proxy URL or API endpoint
-        is_proxy_url = "proxy.runpod.net" in self.config['base_url']
+        is_proxy_url = self._is_proxy_url
         
         if is_proxy_url:
             # Using proxy URL - direct Ollama API
-            base_url = self.config['base_url'].rstrip('/')  # Remove trailing slash if present
-            url = f"{base_url}/api/generate"
+            url = self._ollama_generate_url
             
             # First check if Ollama is running
             try:
-                health_check = requests.get(f"{base_url}/api/tags", timeout=5)
+                health_check = self._session.get(self._ollama_tags_url, timeout=5)
                 health_check.raise_for_status()
                 self.logger.info("Ollama health check passed")
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"Ollama health check failed: {str(e)}")
                 raise LLMError("Ollama service is not accessible. Please check if the pod is running and Ollama is started.")
             
-            headers = {}  # No auth needed for proxy
+            headers = JSON_HEADERS  # No auth needed for proxy
             payload = {
                 "model": self.config["model_name"],
                 "prompt": prompt,
@@ -134,11 +310,8 @@ Answer:"""
             if not self.config['api_key']:
                 raise LLMError("API key is required for RunPod API endpoints")
                 
-            url = f"{self.config['base_url']}/{self.config['endpoint_id']}/run"
-            headers = {
-                "Authorization": f"Bearer {self.config['api_key']}",
-                "Content-Type": "application/json"
-            }
+            url = self._runpod_run_url
+            headers = self._runpod_headers
             payload = {
                 "input": {
                     "prompt": prompt,
@@ -150,11 +323,13 @@ Answer:"""
         
         try:
             self.logger.info(f"Sending request to: {url}")
-            self.logger.debug(f"Request payload: {json.dumps(payload, indent=2)}")
+            body = orjson.dumps(payload)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Request payload: %s", body.decode())
             
-            response = requests.post(url, headers=headers, json=payload, timeout=self.config["timeout"])
+            response = self._session.post(url, headers=headers, data=body, timeout=self.config["timeout"])
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             
             if is_proxy_url:
                 return {
@@ -173,27 +348,35 @@ Answer:"""
                 raise LLMError(f"Failed to communicate with Ollama at {url}. Please check if Ollama is running in the pod.")
             else:
                 raise LLMError(f"Failed to generate response from RunPod: {str(e)}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Error parsing RunPod response: {str(e)}")
             raise LLMError(f"Invalid response from RunPod: {str(e)}")
 
     def is_available(self) -> bool:
-        """Check if the LLM service is available."""
+        """
+        Check if the LLM service is available.
+        
+        Ollama endpoints are probed with a HEAD request, so no response body is
+        transferred. Probes are not retried, so a dead service fails within the
+        (2, 2) second timeout. The result is reused for AVAILABILITY_TTL seconds.
+        """
+        now = time.monotonic()
+        if self._availability is not None and now - self._availability[0] < AVAILABILITY_TTL:
+            return self._availability[1]
+        
         try:
-            if self.deployment_type == DeploymentType.RUNPOD:
-                is_proxy_url = "proxy.runpod.net" in self.config['base_url']
-                if is_proxy_url:
-                    # Check Ollama health
-                    url = f"{self.config['base_url'].rstrip('/')}/api/tags"
-                    response = requests.get(url, timeout=5)
-                else:
-                    # Check RunPod API
-                    url = f"{self.config['base_url']}/{self.config['endpoint_id']}/status"
-                    headers = {"Authorization": f"Bearer {self.config['api_key']}"}
-                    response = requests.get(url, headers=headers, timeout=5)
-            
-            response.raise_for_status()
-            return True
+            if self.deployment_type == DeploymentType.RUNPOD and not self._is_proxy_url:
+                # Check RunPod API
+                response = self._session.get(self._runpod_status_url, headers=self._runpod_headers, timeout=(2, 2))
+            else:
+                # Check Ollama health (local or behind the RunPod proxy)
+                response = self._session.head(self._ollama_tags_url, timeout=(2, 2))
+            available = response.ok
+            if not available:
+                self.logger.error(f"Service availability check failed: HTTP {response.status_code}")
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Service availability check failed: {str(e)}")
-            return False 
\ No newline at end of file
+            available = False
+        
+        self._availability = (now, available)
+        return available
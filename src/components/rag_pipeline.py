@@ -2,31 +2,93 @@
 RAG Pipeline for document processing and retrieval.
 """
 
+import atexit
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import time
-from functools import wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import cache, lru_cache, wraps
 import os
+import json
+import multiprocessing
+import sqlite3
+import threading
+from collections import OrderedDict
 from langchain.schema import Document
+from langchain_core.embeddings import Embeddings
+import chromadb
+from chromadb.config import Settings
+import numpy as np
+import sqlite_vec
+import torch
 
 # LangChain imports
-from langchain_community.vectorstores import Chroma
 from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from ..utils.embedding_cache import CachedEmbeddings, EmbeddingCache
+from ..utils.vector_ops import normalize, quantize_int8, top_k_cosine_int8
 
 logger = logging.getLogger(__name__)
 
-def with_timeout(timeout_seconds: int = 30):
-    """Decorator to add timeout to functions."""
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIMENSION = 384
+
+# INT8 ONNX export used when EMBEDDING_BACKEND=onnx; override with EMBEDDING_ONNX_FILE
+ONNX_QUANTIZED_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Number of chunks embedded and written to Chroma per round trip
+ADD_BATCH_SIZE = 64
+
+# Chunks embedded per call while flushing; large enough for ProcessPoolEmbeddings to shard
+EMBED_WINDOW = 1024
+
+# On CPU, embedding calls with at least this many chunks are spread over worker processes,
+# each limited to EMBED_WORKER_THREADS intra-op threads
+PARALLEL_EMBED_MIN_TEXTS = 256
+EMBED_WORKER_THREADS = 2
+
+# Batch size on CUDA, where a single process already saturates the device
+GPU_BATCH_SIZE = 256
+
+# Buffered chunks are written to Chroma once either threshold is reached
+FLUSH_DOCS = 256
+FLUSH_BYTES = 1_000_000
+
+# Collections smaller than this are searched exactly with NumPy instead of the HNSW index
+INMEMORY_INDEX_LIMIT = 20_000
+
+# Number of (query, k) search results kept by RAGPipeline.query
+QUERY_CACHE_SIZE = 512
+
+
+# HNSW index parameters, applied when the collection is first created
+HNSW_CONFIG = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64
+}
+
+# Chroma collection name; matches the name the LangChain wrapper used, so existing stores keep working
+CHROMA_COLLECTION = "langchain"
+
+def with_deadline(timeout_seconds: int = 30):
+    """
+    Decorator that enforces a deadline on a pipeline method.
+    
+    The call runs on the instance's _executor and the caller stops waiting once the
+    deadline passes; the worker thread itself cannot be interrupted and finishes in the background.
+    """
     def decorator(func):
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            if time.time() - start_time > timeout_seconds:
+        def wrapper(self, *args, **kwargs):
+            future = self._executor.submit(func, self, *args, **kwargs)
+            try:
+                return future.result(timeout=timeout_seconds)
+            except FutureTimeoutError:
                 raise TimeoutError(f"Operation timed out after {timeout_seconds} seconds")
-            return result
         return wrapper
     return decorator
 
@@ -45,44 +107,167 @@ def error_handler(func):
             raise RAGPipelineError(error_msg)
     return wrapper
 
+@cache
+def _resolve(path: str) -> str:
+    """Resolve a storage path to an absolute path once per process."""
+    return str(Path(path).expanduser().resolve())
+
+def _chunk_digest(text: str) -> bytes:
+    """Content hash of a chunk, used to skip chunks that are already stored."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+@lru_cache(maxsize=4)
+def _get_embeddings(model_name: str, device: str, backend: str = "torch") -> HuggingFaceEmbeddings:
+    """Load a sentence-transformers model once per process and share it between pipelines."""
+    logger.info(f"Loading embedding model {model_name} on {device} ({backend})")
+    model_kwargs: Dict[str, Any] = {'device': device}
+    if backend == "onnx":
+        # Pre-quantized INT8 export shipped with the model on the Hugging Face Hub
+        model_kwargs.update(
+            backend="onnx",
+            model_kwargs={"file_name": os.getenv("EMBEDDING_ONNX_FILE", ONNX_QUANTIZED_FILE)}
+        )
+    elif device.startswith("cuda"):
+        model_kwargs["model_kwargs"] = {"torch_dtype": torch.float16}
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs=model_kwargs,
+        encode_kwargs={"batch_size": GPU_BATCH_SIZE if device.startswith("cuda") else ADD_BATCH_SIZE}
+    )
+
+# Set in embedding worker processes by _init_embed_worker
+_worker_model: Optional[Tuple[str, str]] = None
+
+def _init_embed_worker(model_name: str, backend: str) -> None:
+    """Limit the worker's torch threads so the pool does not oversubscribe the cores."""
+    global _worker_model
+    torch.set_num_threads(EMBED_WORKER_THREADS)
+    _worker_model = (model_name, backend)
+
+def _embed_batch(texts: List[str]) -> List[List[float]]:
+    """Embed one batch in a worker process."""
+    model_name, backend = _worker_model
+    return _get_embeddings(model_name, "cpu", backend).embed_documents(texts)
+
+class ProcessPoolEmbeddings(Embeddings):
+    """
+    CPU embeddings that shard large embed_documents calls across worker processes.
+    Each worker loads its own copy of the model and runs its own BLAS threads, which scales
+    better than one process's intra-op threads at these batch sizes. Small calls and queries
+    run in the current process.
+    """
+    def __init__(self, model_name: str, backend: str = "torch"):
+        self.model_name = model_name
+        self.backend = backend
+        self._local = _get_embeddings(model_name, "cpu", backend)
+        self._workers = (os.cpu_count() or 1) // EMBED_WORKER_THREADS
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                logger.info(f"Starting {self._workers} embedding worker processes")
+                # spawn: forking a process that already runs torch threads can deadlock
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_embed_worker,
+                    initargs=(self.model_name, self.backend)
+                )
+            return self._pool
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if len(texts) < PARALLEL_EMBED_MIN_TEXTS or self._workers < 2:
+            return self._local.embed_documents(texts)
+        batches = [texts[i:i + ADD_BATCH_SIZE] for i in range(0, len(texts), ADD_BATCH_SIZE)]
+        return [vector for batch in self._get_pool().map(_embed_batch, batches) for vector in batch]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._local.embed_query(text)
+
+def _create_embeddings(embedding_cache_dir: Optional[str] = None) -> CachedEmbeddings:
+    """
+    Create the shared embedding model wrapped in the embedding cache.
+    
+    The device comes from EMBEDDING_DEVICE (default: CUDA when available, else CPU) and the
+    backend from EMBEDDING_BACKEND ("torch" or "onnx", default "torch").
+    """
+    device = os.getenv("EMBEDDING_DEVICE") or ("cuda" if torch.cuda.is_available() else "cpu")
+    backend = os.getenv("EMBEDDING_BACKEND", "torch")
+    if backend not in ("torch", "onnx"):
+        raise ValueError(f"Unsupported EMBEDDING_BACKEND: {backend}. Use 'torch' or 'onnx'.")
+    
+    # Quantized embeddings differ slightly, so they are cached separately
+    namespace = EMBEDDING_MODEL if backend == "torch" else f"{EMBEDDING_MODEL}@{backend}"
+    if device == "cpu":
+        model = ProcessPoolEmbeddings(EMBEDDING_MODEL, backend)
+    else:
+        model = _get_embeddings(EMBEDDING_MODEL, device, backend)
+    return CachedEmbeddings(
+        model,
+        EmbeddingCache(cache_dir=embedding_cache_dir),
+        namespace=namespace
+    )
+
 class RAGPipeline:
     """
     A Retrieval-Augmented Generation (RAG) pipeline that combines document retrieval with language model generation.
     This class handles document storage, embedding, and retrieval using ChromaDB as the vector store.
     """
-    def __init__(self, persist_directory: str = "chroma_db"):
+    def __init__(self, persist_directory: str = "chroma_db", embedding_cache_dir: Optional[str] = None):
         """
         Initialize the RAG pipeline with a vector store and embedding model.
         
         Args:
             persist_directory (str): Directory where the vector store will be persisted.
                                     Defaults to "chroma_db" in the current directory.
+            embedding_cache_dir (Optional[str]): Directory for the on-disk embedding cache.
+                                                 Defaults to None (in-memory cache only).
         """
         self.logger = logging.getLogger(__name__)
-        self.persist_directory = str(Path(persist_directory).expanduser().absolute())
+        self.persist_directory = _resolve(persist_directory)
         
         try:
             # Initialize embedding model
             self.logger.info(f"Initializing RAG pipeline with persist directory: {self.persist_directory}")
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2",
-                model_kwargs={'device': 'cpu'}
-            )
+            self.embeddings = _create_embeddings(embedding_cache_dir)
             
             # Initialize vector store
             self.logger.info("Initializing ChromaDB vector store")
-            self.vector_store = Chroma(
-                persist_directory=self.persist_directory,
-                embedding_function=self.embeddings
+            self.client = chromadb.PersistentClient(
+                path=self.persist_directory,
+                settings=Settings(anonymized_telemetry=False)
             )
+            self.collection = self._create_collection()
             
-            # Initialize text splitter
-            self.text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200,
-                length_function=len,
-                separators=["\n\n", "\n", " ", ""]
-            )
+            # Runs deadline-bound calls (see with_deadline)
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chroma-call")
+            
+            # Chunks waiting to be written; see add_documents and flush
+            self._pending_texts: List[str] = []
+            self._pending_meta: List[Dict[str, Any]] = []
+            self._buffer_bytes = 0
+            self._buffer_lock = threading.Lock()
+            # Serializes flushes; held while chunks are embedded and written, unlike _buffer_lock
+            self._flush_lock = threading.Lock()
+            
+            # Search results per (normalized query, k, version); the version is
+            # bumped on every write so stale results are never served
+            self._query_cache: "OrderedDict[tuple, List[Document]]" = OrderedDict()
+            self._query_cache_lock = threading.Lock()
+            self._version = 0
+            atexit.register(self.flush)
+            
+            # Normalized int8-quantized embeddings, their per-row scales and the texts and metadata
+            # of the whole collection while it is small enough; None once it outgrows INMEMORY_INDEX_LIMIT.
+            # Documents are only built for search results.
+            self._emb_matrix: Optional[np.ndarray] = None
+            self._emb_scales: Optional[np.ndarray] = None
+            self._emb_texts: List[str] = []
+            self._emb_metadatas: List[Dict[str, Any]] = []
+            self._load_matrix()
             
             self.logger.info("RAG pipeline initialization complete")
             
@@ -90,46 +275,173 @@ class RAGPipeline:
             self.logger.error(f"Failed to initialize RAG pipeline: {str(e)}")
             raise RAGPipelineError(f"RAG pipeline initialization failed: {str(e)}")
 
-    @with_timeout(timeout_seconds=60)
-    @error_handler
+    def _create_collection(self) -> chromadb.Collection:
+        """Open the Chroma collection, creating it with the HNSW settings if needed."""
+        return self.client.get_or_create_collection(CHROMA_COLLECTION, metadata=HNSW_CONFIG)
+
+    def _load_matrix(self) -> None:
+        """Load the collection into the in-memory index if it is below INMEMORY_INDEX_LIMIT."""
+        collection = self.collection
+        if collection.count() >= INMEMORY_INDEX_LIMIT:
+            self._drop_matrix()
+            return
+        
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        embeddings = np.asarray(data["embeddings"], dtype=np.float32).reshape(-1, EMBEDDING_DIMENSION)
+        self._emb_matrix, self._emb_scales = quantize_int8(normalize(embeddings))
+        self._emb_texts = list(data["documents"])
+        self._emb_metadatas = [metadata or {} for metadata in data["metadatas"]]
+        logger.info(f"Loaded {len(self._emb_texts)} documents into the in-memory index")
+
+    def _drop_matrix(self) -> None:
+        """Disable the in-memory index; searches go to Chroma."""
+        self._emb_matrix, self._emb_scales = None, None
+        self._emb_texts, self._emb_metadatas = [], []
+
+    def _append_to_matrix(self, embeddings: List[List[float]], texts: List[str],
+                          metadatas: List[Dict[str, Any]]) -> None:
+        """Add newly written chunks to the in-memory index. The caller must hold _buffer_lock."""
+        if self._emb_matrix is None or not texts:
+            return
+        if len(self._emb_texts) + len(texts) >= INMEMORY_INDEX_LIMIT:
+            logger.info("Collection outgrew the in-memory index; searching with Chroma from now on")
+            self._drop_matrix()
+            return
+        # New arrays and lists are built, so searches holding the old ones stay consistent
+        quantized, scales = quantize_int8(normalize(embeddings))
+        self._emb_matrix = np.vstack([self._emb_matrix, quantized])
+        self._emb_scales = np.concatenate([self._emb_scales, scales])
+        self._emb_texts = self._emb_texts + texts
+        self._emb_metadatas = self._emb_metadatas + metadatas
+
     def add_documents(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         Add documents to the vector store for later retrieval.
         
+        Documents are buffered in memory and written once FLUSH_DOCS chunks or
+        FLUSH_BYTES of text are pending; flush() and query() write them earlier.
+        
         Args:
             texts (List[str]): List of text chunks to be added to the vector store
             metadatas (List[Dict[str, Any]], optional): List of metadata dictionaries for each text chunk.
             
         Raises:
             RAGPipelineError: If document addition fails
-            TimeoutError: If operation takes too long
+            TimeoutError: If buffering takes too long
+            
+        Note:
+            Only buffering runs under the 60 second deadline. Writing a full buffer cannot be
+            cancelled, so it is not reported as a timeout while it is still landing.
         """
+        if self._buffer(texts, metadatas):
+            self.flush()
+
+    @with_deadline(timeout_seconds=60)
+    @error_handler
+    def _buffer(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]]) -> bool:
+        """Add documents to the write buffer and return whether it is full."""
         if not texts:
             logger.warning("No documents provided to add_documents")
-            return
+            return False
 
-        logger.info(f"Adding {len(texts)} documents to vector store")
+        logger.info(f"Buffering {len(texts)} documents for vector store")
         if metadatas is None:
             metadatas = [{"source": f"document_{i}"} for i in range(len(texts))]
             logger.debug(f"Generated default metadata for {len(texts)} documents")
         
+        with self._buffer_lock:
+            self._pending_texts.extend(texts)
+            self._pending_meta.extend(metadatas)
+            self._buffer_bytes += sum(len(text) for text in texts)
+            return len(self._pending_texts) >= FLUSH_DOCS or self._buffer_bytes >= FLUSH_BYTES
+
+    @error_handler
+    def flush(self) -> None:
+        """
+        Write all buffered documents to the vector store.
+        
+        Raises:
+            RAGPipelineError: If writing fails; the documents stay buffered
+        """
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """
+        Write the buffered documents to Chroma. The caller must hold _flush_lock.
+        
+        The buffer is taken over up front, so add_documents() and query() only wait
+        for _buffer_lock briefly, not for the embedding and writing.
+        """
+        with self._buffer_lock:
+            if not self._pending_texts:
+                return
+            texts, metadatas = self._pending_texts, self._pending_meta
+            self._pending_texts, self._pending_meta = [], []
+            self._buffer_bytes = 0
+        
+        logger.info(f"Adding {len(texts)} documents to vector store")
         try:
-            # Create documents with metadata
-            documents = [
-                Document(page_content=text, metadata=metadata)
-                for text, metadata in zip(texts, metadatas)
-            ]
-            
-            # Add documents to vector store
-            self.vector_store.add_documents(documents)
-            logger.info(f"Successfully added {len(documents)} documents to vector store")
+            # Ids are content hashes, so a chunk repeated within the buffer is only added once.
+            # ids, texts and metadatas are built once as parallel lists and only sliced from here on.
+            seen = set()
+            ids, unique_texts, unique_metadatas = [], [], []
+            for text, metadata in zip(texts, metadatas):
+                chunk_id = _chunk_digest(text).hex()
+                if chunk_id not in seen:
+                    seen.add(chunk_id)
+                    ids.append(chunk_id)
+                    unique_texts.append(text)
+                    unique_metadatas.append(metadata)
+            
+            # Skip chunks that an earlier upload already stored
+            collection = self.collection
+            existing = set()
+            for start in range(0, len(ids), ADD_BATCH_SIZE):
+                existing.update(collection.get(ids=ids[start:start + ADD_BATCH_SIZE], include=[])["ids"])
+            if existing:
+                keep = [i for i, chunk_id in enumerate(ids) if chunk_id not in existing]
+                ids = [ids[i] for i in keep]
+                unique_texts = [unique_texts[i] for i in keep]
+                unique_metadatas = [unique_metadatas[i] for i in keep]
+                logger.info(f"Skipped {len(existing)} documents already in vector store")
+            
+            # Embed a window at a time and write it in fixed-size batches straight to the Chroma collection
+            added = 0
+            added_embeddings: List[List[float]] = []
+            try:
+                for window_start in range(0, len(ids), EMBED_WINDOW):
+                    window_embeddings = self.embeddings.embed_documents(
+                        unique_texts[window_start:window_start + EMBED_WINDOW]
+                    )
+                    for offset in range(0, len(window_embeddings), ADD_BATCH_SIZE):
+                        batch_embeddings = window_embeddings[offset:offset + ADD_BATCH_SIZE]
+                        lo, hi = window_start + offset, window_start + offset + len(batch_embeddings)
+                        collection.add(
+                            ids=ids[lo:hi],
+                            embeddings=batch_embeddings,
+                            documents=unique_texts[lo:hi],
+                            metadatas=unique_metadatas[lo:hi]
+                        )
+                        added = hi
+                        added_embeddings.extend(batch_embeddings)
+            finally:
+                # Batches that reached Chroma are searchable even if a later one failed
+                with self._buffer_lock:
+                    self._append_to_matrix(added_embeddings, unique_texts[:added], unique_metadatas[:added])
+                    if added:
+                        self._version += 1
+            logger.info(f"Successfully added {added} documents to vector store")
         except Exception as e:
+            # Buffer the documents again so the next flush retries them; stored ones are skipped by id
+            with self._buffer_lock:
+                self._pending_texts = texts + self._pending_texts
+                self._pending_meta = metadatas + self._pending_meta
+                self._buffer_bytes += sum(len(text) for text in texts)
             error_msg = f"Error adding documents to vector store: {str(e)}"
             logger.error(error_msg)
             raise RAGPipelineError(error_msg)
 
-    @with_timeout(timeout_seconds=30)
-    @error_handler
     def query(self, query: str, k: int = 4) -> List[Document]:
         """
         Query the vector store for relevant documents based on semantic similarity.
@@ -143,8 +455,20 @@ class RAGPipeline:
             
         Raises:
             RAGPipelineError: If query fails
-            TimeoutError: If operation takes too long
+            TimeoutError: If the search takes too long
+            
+        Note:
+            Buffered documents are written first, so every document added before the
+            query is searched. Only the search itself runs under the 30 second deadline;
+            writing the buffer does not count against it.
         """
+        self.flush()
+        return self._search(query, k)
+
+    @with_deadline(timeout_seconds=30)
+    @error_handler
+    def _search(self, query: str, k: int) -> List[Document]:
+        """Search the written documents; see query()."""
         if not query.strip():
             logger.warning("Empty query received")
             return []
@@ -152,16 +476,50 @@ class RAGPipeline:
         logger.info(f"Processing query: {query}")
         logger.debug(f"Search parameters: k={k}")
         
+        with self._buffer_lock:
+            # The embedding model is uncased, so case and spacing do not change the results
+            key = (" ".join(query.lower().split()), k, self._version)
+            emb_matrix, emb_scales = self._emb_matrix, self._emb_scales
+            emb_texts, emb_metadatas = self._emb_texts, self._emb_metadatas
+        
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                logger.info(f"Serving {len(cached)} cached documents for query")
+                return list(cached)
+        
         try:
-            # Perform similarity search
-            logger.debug("Performing similarity search")
-            results = self.vector_store.similarity_search(query, k=k)
+            if emb_matrix is not None:
+                # Exact search over the in-memory index
+                logger.debug("Performing in-memory similarity search")
+                top, _ = top_k_cosine_int8(normalize(self.embeddings.embed_query(query)), emb_matrix, emb_scales, k)
+                results = [
+                    Document(page_content=emb_texts[i], metadata=emb_metadatas[i])
+                    for i in top.tolist()
+                ]
+            else:
+                # Perform similarity search
+                logger.debug("Performing similarity search")
+                found = self.collection.query(
+                    query_embeddings=[self.embeddings.embed_query(query)],
+                    n_results=k,
+                    include=["documents", "metadatas"]
+                )
+                results = [
+                    Document(page_content=text, metadata=metadata or {})
+                    for text, metadata in zip(found["documents"][0], found["metadatas"][0])
+                ]
             
             # Extract and log results
             logger.info(f"Found {len(results)} relevant documents for query")
-            logger.debug(f"Retrieved documents: {results}")
+            logger.debug("Retrieved documents: %s", results)
             
-            return results
+            with self._query_cache_lock:
+                self._query_cache[key] = results
+                if len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+            return list(results)
         except Exception as e:
             error_msg = f"Error querying vector store: {str(e)}"
             logger.error(error_msg)
@@ -176,22 +534,28 @@ class RAGPipeline:
             RAGPipelineError: If clearing fails
         """
         logger.info("Clearing vector store")
-        try:
-            # Delete the existing collection
-            logger.debug("Deleting existing collection")
-            self.vector_store.delete_collection()
-            
-            # Reinitialize the vector store
-            logger.debug("Reinitializing vector store")
-            self.vector_store = Chroma(
-                persist_directory=self.persist_directory,
-                embedding_function=self.embeddings
-            )
-            logger.info("Successfully cleared and reinitialized vector store")
-        except Exception as e:
-            error_msg = f"Error clearing vector store: {str(e)}"
-            logger.error(error_msg)
-            raise RAGPipelineError(error_msg)
+        # Wait for any running flush, so it does not write into the collection being replaced
+        with self._flush_lock:
+            with self._buffer_lock:
+                self._pending_texts, self._pending_meta = [], []
+                self._buffer_bytes = 0
+                self._version += 1
+            
+            try:
+                # Delete the existing collection
+                logger.debug("Deleting existing collection")
+                self.client.delete_collection(CHROMA_COLLECTION)
+                
+                # Reinitialize the vector store
+                logger.debug("Reinitializing vector store")
+                self.collection = self._create_collection()
+                with self._buffer_lock:
+                    self._load_matrix()
+                logger.info("Successfully cleared and reinitialized vector store")
+            except Exception as e:
+                error_msg = f"Error clearing vector store: {str(e)}"
+                logger.error(error_msg)
+                raise RAGPipelineError(error_msg)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -201,10 +565,9 @@ class RAGPipeline:
             Dict[str, Any]: Statistics about the vector store
         """
         try:
-            collection = self.vector_store._collection
             return {
-                "total_documents": collection.count(),
-                "embedding_dimension": collection.dimension,
+                "total_documents": self.collection.count(),
+                "embedding_dimension": EMBEDDING_DIMENSION,
                 "persist_directory": self.persist_directory
             }
         except Exception as e:
@@ -212,4 +575,189 @@ class RAGPipeline:
             return {
                 "error": str(e),
                 "persist_directory": self.persist_directory
-            } 
\ No newline at end of file
+            } 
+
+class SqliteVecRAGPipeline:
+    """
+    A lightweight alternative to RAGPipeline for small and medium corpora.
+    Chunks and their embeddings live in a single SQLite file; nearest-neighbour search
+    runs in the sqlite-vec vec0 virtual table, so inserts are plain SQL without Chroma's overhead.
+    Embeddings are stored as int8 (a quarter of float32); cosine distance is scale-invariant,
+    so the per-vector quantization scales do not need to be kept.
+    """
+    def __init__(self, db_path: str = "rag.sqlite3", embedding_cache_dir: Optional[str] = None):
+        """
+        Initialize the pipeline with a SQLite database and embedding model.
+        
+        Args:
+            db_path (str): Path of the SQLite database file. Defaults to "rag.sqlite3".
+            embedding_cache_dir (Optional[str]): Directory for the on-disk embedding cache.
+                                                 Defaults to None (in-memory cache only).
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = _resolve(db_path)
+        
+        try:
+            self.logger.info(f"Initializing sqlite-vec RAG pipeline with database: {self.db_path}")
+            self.embeddings = _create_embeddings(embedding_cache_dir)
+            
+            # The connection is shared across threads (see with_deadline); access is serialized by the lock
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.enable_load_extension(True)
+            sqlite_vec.load(self.conn)
+            self.conn.enable_load_extension(False)
+            self._lock = threading.Lock()
+            
+            with self.conn:
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS chunks ("
+                    "id INTEGER PRIMARY KEY, content TEXT NOT NULL, metadata TEXT NOT NULL)"
+                )
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS vec_chunks USING vec0("
+                    f"embedding int8[{EMBEDDING_DIMENSION}] distance_metric=cosine)"
+                )
+                # Content hashes of stored chunks, so re-uploads are not embedded again
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS chunk_hashes ("
+                    "hash BLOB PRIMARY KEY, chunk_id INTEGER NOT NULL) WITHOUT ROWID"
+                )
+            
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sqlite-vec-call")
+            self.logger.info("sqlite-vec RAG pipeline initialization complete")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize sqlite-vec RAG pipeline: {str(e)}")
+            raise RAGPipelineError(f"RAG pipeline initialization failed: {str(e)}")
+
+    @error_handler
+    def add_documents(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Add documents to the database for later retrieval.
+        
+        Args:
+            texts (List[str]): List of text chunks to be added
+            metadatas (List[Dict[str, Any]], optional): List of metadata dictionaries for each text chunk.
+            
+        Raises:
+            RAGPipelineError: If document addition fails
+            
+        Note:
+            Unlike query(), this runs without a deadline: embedding and writing cannot be
+            cancelled, so a timeout would report a failure for chunks that still land.
+        """
+        if not texts:
+            logger.warning("No documents provided to add_documents")
+            return
+
+        logger.info(f"Adding {len(texts)} documents to sqlite-vec store")
+        if metadatas is None:
+            metadatas = [{"source": f"document_{i}"} for i in range(len(texts))]
+        
+        # Keep the first occurrence of each chunk and drop those already stored
+        unique = {}
+        for text, metadata in zip(texts, metadatas):
+            unique.setdefault(_chunk_digest(text), (text, metadata))
+        digests = list(unique)
+        existing = set()
+        with self._lock:
+            for start in range(0, len(digests), ADD_BATCH_SIZE):
+                batch = digests[start:start + ADD_BATCH_SIZE]
+                existing.update(row[0] for row in self.conn.execute(
+                    f"SELECT hash FROM chunk_hashes WHERE hash IN ({', '.join('?' * len(batch))})",
+                    batch
+                ))
+        digests = [digest for digest in digests if digest not in existing]
+        if existing:
+            logger.info(f"Skipped {len(existing)} documents already in sqlite-vec store")
+        if not digests:
+            return
+        
+        new_texts = [unique[digest][0] for digest in digests]
+        quantized, _ = quantize_int8(self.embeddings.embed_documents(new_texts))
+        added = 0
+        with self._lock, self.conn:
+            for digest, embedding in zip(digests, quantized):
+                # Checked again in the write transaction: a concurrent call may have stored it meanwhile
+                if self.conn.execute("SELECT 1 FROM chunk_hashes WHERE hash = ?", (digest,)).fetchone():
+                    continue
+                text, metadata = unique[digest]
+                cursor = self.conn.execute(
+                    "INSERT INTO chunks (content, metadata) VALUES (?, ?)",
+                    (text, json.dumps(metadata))
+                )
+                self.conn.execute(
+                    "INSERT INTO vec_chunks (rowid, embedding) VALUES (?, vec_int8(?))",
+                    (cursor.lastrowid, embedding.tobytes())
+                )
+                self.conn.execute(
+                    "INSERT INTO chunk_hashes (hash, chunk_id) VALUES (?, ?)",
+                    (digest, cursor.lastrowid)
+                )
+                added += 1
+        logger.info(f"Successfully added {added} documents to sqlite-vec store")
+
+    def flush(self) -> None:
+        """Writes are not buffered in this pipeline; provided for parity with RAGPipeline."""
+        pass
+
+    @with_deadline(timeout_seconds=30)
+    @error_handler
+    def query(self, query: str, k: int = 4) -> List[Document]:
+        """
+        Query the database for the k chunks nearest to the query embedding.
+        
+        Args:
+            query (str): The search query text
+            k (int): Number of most relevant documents to return. Defaults to 4.
+            
+        Returns:
+            List[Document]: List of the k most relevant document chunks
+        """
+        if not query.strip():
+            logger.warning("Empty query received")
+            return []
+
+        logger.info(f"Processing query: {query}")
+        embedding, _ = quantize_int8(self.embeddings.embed_query(query))
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT c.content, c.metadata FROM ("
+                "SELECT rowid, distance FROM vec_chunks WHERE embedding MATCH vec_int8(?) AND k = ?"
+                ") AS v JOIN chunks AS c ON c.id = v.rowid ORDER BY v.distance",
+                (embedding.tobytes(), k)
+            ).fetchall()
+        
+        logger.info(f"Found {len(rows)} relevant documents for query")
+        return [Document(page_content=content, metadata=json.loads(metadata)) for content, metadata in rows]
+
+    @error_handler
+    def clear(self) -> None:
+        """Delete all chunks and embeddings from the database."""
+        logger.info("Clearing sqlite-vec store")
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM vec_chunks")
+            self.conn.execute("DELETE FROM chunks")
+            self.conn.execute("DELETE FROM chunk_hashes")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the database.
+        
+        Returns:
+            Dict[str, Any]: Statistics about the store
+        """
+        try:
+            with self._lock:
+                total = self.conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            return {
+                "total_documents": total,
+                "embedding_dimension": EMBEDDING_DIMENSION,
+                "db_path": self.db_path
+            }
+        except Exception as e:
+            logger.error(f"Error getting sqlite-vec stats: {str(e)}")
+            return {
+                "error": str(e),
+                "db_path": self.db_path
+            }
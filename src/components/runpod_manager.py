@@ -1,12 +1,32 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
+import itertools
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# RunPod endpoint ids are at least 8 alphanumeric characters
+_POD_ID_RE = re.compile(r'^[a-zA-Z0-9]{8,}$')
+
+# Seconds a GET /pods/{id} response is reused by get_pod_status and get_pod_details
+POD_CACHE_TTL = 2.0
+
+# Seconds between wait_for_pod polls: frequent while a state change is likely, then backing off;
+# the last value repeats
+POLL_SCHEDULE = (1, 2, 3, 5, 5, 8, 10, 15, 20, 30)
+
+# (connect, read) timeouts in seconds for RunPod API requests and for the Ollama health check
+API_TIMEOUT = (5, 15)
+OLLAMA_CHECK_TIMEOUT = (3, 5)
+
 class RunPodManager:
     def __init__(self):
         self.api_key = os.getenv("RUNPOD_API_KEY")
@@ -24,19 +44,59 @@ class RunPodManager:
             raise ValueError("RUNPOD_ENDPOINT_ID must be set in environment variables")
             
         # Validate endpoint ID format
-        if not re.match(r'^[a-zA-Z0-9]{8,}$', self.pod_id):
+        if not _POD_ID_RE.match(self.pod_id):
             raise ValueError(f"Invalid RUNPOD_ENDPOINT_ID format: {self.pod_id}. It should be at least 8 alphanumeric characters.")
             
+        # Keep connections to the RunPod API and the pod proxy alive across polls
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        # The Ollama health check is polled on its own schedule, so it fails fast instead of retrying
+        self._session.mount(self.get_ollama_url(), HTTPAdapter(max_retries=0))
+        atexit.register(self.close)
+        
+        # Last GET /pods/{id} response as (monotonic timestamp, data)
+        self._pod_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+            
         logger.info(f"Initialized RunPod manager with endpoint ID: {self.pod_id}")
 
-    def get_pod_status(self) -> str:
-        """Get the current status of the RunPod pod."""
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def _get_pod(self, ttl: float) -> Dict[str, Any]:
+        """
+        Fetch the pod record, reusing a response younger than ttl seconds.
+        
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        now = time.monotonic()
+        if self._pod_cache is not None and now - self._pod_cache[0] < ttl:
+            return self._pod_cache[1]
+        
+        url = f"{self.base_url}/pods/{self.pod_id}"
+        logger.debug(f"Fetching pod at: {url}")
+        response = self._session.get(url, timeout=API_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+        self._pod_cache = (now, data)
+        return data
+
+    def get_pod_status(self, ttl: float = POD_CACHE_TTL) -> str:
+        """
+        Get the current status of the RunPod pod.
+        
+        Args:
+            ttl (float): Reuse a pod record fetched less than this many seconds ago.
+                         Pass 0 to force a fresh request.
+        """
         try:
-            url = f"{self.base_url}/pods/{self.pod_id}"
-            logger.debug(f"Checking pod status at: {url}")
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_pod(ttl)
             
             status = data.get("desiredStatus", "UNKNOWN")
             logger.info(f"Pod status: {status}")
@@ -58,9 +118,9 @@ class RunPodManager:
         try:
             url = f"{self.base_url}/pods/{self.pod_id}/start"
             logger.debug(f"Starting pod at: {url}")
-            response = requests.post(url, headers=self.headers)
+            self._pod_cache = None
+            response = self._session.post(url, timeout=API_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
             
             logger.info("Successfully started RunPod pod")
         except requests.exceptions.RequestException as e:
@@ -80,9 +140,9 @@ class RunPodManager:
         try:
             url = f"{self.base_url}/pods/{self.pod_id}/stop"
             logger.debug(f"Stopping pod at: {url}")
-            response = requests.post(url, headers=self.headers)
+            self._pod_cache = None
+            response = self._session.post(url, timeout=API_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
             
             logger.info("Successfully stopped RunPod pod")
         except requests.exceptions.RequestException as e:
@@ -97,15 +157,16 @@ class RunPodManager:
             logger.error(f"Error stopping pod: {str(e)}")
             raise
 
-    def get_pod_details(self) -> Dict[str, Any]:
-        """Get detailed information about the pod."""
+    def get_pod_details(self, ttl: float = POD_CACHE_TTL) -> Dict[str, Any]:
+        """
+        Get detailed information about the pod.
+        
+        Args:
+            ttl (float): Reuse a pod record fetched less than this many seconds ago.
+                         Pass 0 to force a fresh request.
+        """
         try:
-            url = f"{self.base_url}/pods/{self.pod_id}"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            return data
+            return dict(self._get_pod(ttl))
         except requests.exceptions.RequestException as e:
             error_msg = f"Failed to get pod details: {str(e)}"
             logger.error(error_msg)
@@ -129,10 +190,15 @@ class RunPodManager:
         return f"https://{self.pod_id}-8888.proxy.runpod.net"
 
     def check_ollama_status(self) -> bool:
-        """Check if Ollama is running and accessible."""
+        """
+        Check if Ollama is running and accessible.
+        
+        Sends a HEAD request, so the model list is never downloaded.
+        """
         try:
             url = f"{self.get_ollama_url()}/api/tags"
-            response = requests.get(url)
+            # The proxy needs no RunPod credentials
+            response = self._session.head(url, headers={"Authorization": None}, timeout=OLLAMA_CHECK_TIMEOUT)
             response.raise_for_status()
             return True
         except Exception as e:
@@ -140,31 +206,66 @@ class RunPodManager:
             return False
 
     def wait_for_pod(self, timeout: int = 300) -> bool:
-        """Wait for the pod to be ready, with timeout."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                status = self.get_pod_status()
-                if status == "RUNNING":
-                    # Also check if Ollama is accessible
-                    if self.check_ollama_status():
+        """
+        Wait for the pod to be ready, with timeout.
+        
+        Polls follow POLL_SCHEDULE. Until the pod reports RUNNING, its status and Ollama are
+        checked concurrently, so a pod whose Ollama is already up is detected in one round trip;
+        after that only Ollama is polled.
+        """
+        deadline = time.monotonic() + timeout
+        delays = itertools.chain(POLL_SCHEDULE, itertools.repeat(POLL_SCHEDULE[-1]))
+        pod_running = False
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="runpod-poll")
+        try:
+            while True:
+                try:
+                    if pod_running:
+                        ollama_ready = self.check_ollama_status()
+                    else:
+                        # The RunPod API and the pod proxy are different hosts; query both at once
+                        status_future = pool.submit(self.get_pod_status, 0)
+                        ollama_future = pool.submit(self.check_ollama_status)
+                        status = status_future.result()
+                        if status in ["FAILED", "TERMINATED"]:
+                            logger.error(f"Pod failed to start. Status: {status}")
+                            return False
+                        pod_running = status == "RUNNING"
+                        ollama_ready = pod_running and ollama_future.result()
+                    
+                    if ollama_ready:
                         logger.info("Pod is running and Ollama is accessible")
                         return True
-                    else:
+                    if pod_running:
                         logger.info("Pod is running but waiting for Ollama to be ready...")
-                elif status in ["FAILED", "TERMINATED"]:
-                    logger.error(f"Pod failed to start. Status: {status}")
+                    else:
+                        logger.info(f"Waiting for pod to start... Current status: {status}")
+                except Exception as e:
+                    logger.error(f"Error while waiting for pod: {str(e)}")
                     return False
-                logger.info(f"Waiting for pod to start... Current status: {status}")
-                time.sleep(5)
-            except Exception as e:
-                logger.error(f"Error while waiting for pod: {str(e)}")
-                return False
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(next(delays), remaining))
+        finally:
+            # Do not wait for a health check still in flight when returning early
+            pool.shutdown(wait=False, cancel_futures=True)
         logger.error("Timeout waiting for pod to start")
         return False
 
-# Create and expose the singleton instance
-runpod_manager = RunPodManager()
+# Shared instance, created on first use so importing this module needs no RunPod settings
+_instance: Optional[RunPodManager] = None
+_instance_lock = threading.Lock()
+
+def get_runpod_manager() -> RunPodManager:
+    """Return the process-wide RunPodManager, creating it on first call."""
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = RunPodManager()
+        return _instance
 
-# Export the instance and its methods
-__all__ = ['runpod_manager'] 
\ No newline at end of file
+# Export the class and the accessor
+__all__ = ['RunPodManager', 'get_runpod_manager']
+ 
\ No newline at end of file
@@ -5,7 +5,8 @@ This module contains settings and checks to ensure compliance with GDPR and EU A
 
 import os
 import logging
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from datetime import datetime, timedelta
 
 class GDPRConfig:
@@ -19,14 +20,14 @@ class GDPRConfig:
         self.logger = logging.getLogger(__name__)
         
         # Data retention settings (in days)
-        self.retention_periods = {
+        self._retention_periods = {
             "user_queries": 30,  # Store queries for 30 days
             "document_embeddings": 365,  # Keep embeddings for 1 year
             "processing_logs": 90,  # Keep logs for 90 days
         }
         
         # Data processing settings
-        self.processing_settings = {
+        self._processing_settings = {
             "data_minimization": True,  # Only process necessary data
             "purpose_limitation": True,  # Process only for specified purposes
             "storage_limitation": True,  # Enforce retention periods
@@ -34,19 +35,66 @@ class GDPRConfig:
         }
         
         # Privacy settings
-        self.privacy_settings = {
+        self._privacy_settings = {
             "anonymize_queries": True,  # Remove personal identifiers from queries
             "log_minimal_data": True,  # Log only necessary information
             "secure_storage": True,  # Ensure secure storage of data
         }
         
         # EU AI Act compliance
-        self.ai_compliance = {
+        self._ai_compliance = {
             "transparency": True,  # Provide clear information about AI usage
             "human_oversight": True,  # Enable human review of AI decisions
             "risk_assessment": True,  # Regular risk assessments
             "documentation": True,  # Maintain documentation of AI system
         }
+        
+        # Read-only views of the settings; update_setting is the only way to change them
+        self.retention_periods = MappingProxyType(self._retention_periods)
+        self.processing_settings = MappingProxyType(self._processing_settings)
+        self.privacy_settings = MappingProxyType(self._privacy_settings)
+        self.ai_compliance = MappingProxyType(self._ai_compliance)
+        
+        # Derived state, rebuilt by update_setting
+        self._report_cache: Optional[Mapping[str, Any]] = None
+        self._refresh_derived()
+    
+    def _refresh_derived(self) -> None:
+        """Recompute values derived from the settings and drop the cached report."""
+        # Retention period per data type as a ready-made timedelta, for "now + offset" sweeps
+        self._retention_offsets = {
+            data_type: timedelta(days=days) for data_type, days in self.retention_periods.items()
+        }
+        self._processing_ok = (
+            self.processing_settings["data_minimization"]
+            and self.processing_settings["local_processing"]
+        )
+        self._report_cache = None
+    
+    def update_setting(self, section: str, key: str, value: Any) -> None:
+        """
+        Change a single setting. The settings attributes are read-only views, so this is the
+        only way to modify them.
+        
+        Args:
+            section (str): One of "retention_periods", "processing_settings",
+                           "privacy_settings" or "ai_compliance"
+            key (str): Name of the setting
+            value (Any): New value
+            
+        Raises:
+            ValueError: If the section does not exist
+        """
+        settings = {
+            "retention_periods": self._retention_periods,
+            "processing_settings": self._processing_settings,
+            "privacy_settings": self._privacy_settings,
+            "ai_compliance": self._ai_compliance,
+        }.get(section)
+        if settings is None:
+            raise ValueError(f"Unknown settings section: {section}")
+        settings[key] = value
+        self._refresh_derived()
     
     def validate_processing(self, data_type: str, purpose: str) -> bool:
         """
@@ -59,6 +107,9 @@ class GDPRConfig:
         Returns:
             bool: True if processing is compliant
         """
+        if self._processing_ok:
+            return True
+            
         # Check if processing is necessary
         if not self.processing_settings["data_minimization"]:
             self.logger.warning("Data minimization not enforced")
@@ -81,8 +132,28 @@ class GDPRConfig:
         Returns:
             datetime: Date when data should be deleted
         """
-        retention_days = self.retention_periods.get(data_type, 30)
-        return datetime.now() + timedelta(days=retention_days)
+        return self.get_retention_dates([data_type])[data_type]
+    
+    def get_retention_dates(self, data_types: List[str]) -> Dict[str, datetime]:
+        """
+        Get the retention end dates for several data types.
+        
+        Args:
+            data_types (List[str]): Types of data
+            
+        Returns:
+            Dict[str, datetime]: Date when data should be deleted, per data type
+            
+        Note:
+            The current time is read once, so all dates share the same anchor.
+            Unknown data types are kept for 30 days.
+        """
+        now = datetime.now()
+        default = timedelta(days=30)
+        return {
+            data_type: now + self._retention_offsets.get(data_type, default)
+            for data_type in data_types
+        }
     
     def should_anonymize(self, data: str) -> bool:
         """
@@ -107,34 +178,39 @@ class GDPRConfig:
             data_type (str): Type of data processed
             purpose (str): Purpose of processing
             metadata (Dict, optional): Additional metadata
+            
+        Note:
+            Nothing is built when INFO is disabled; otherwise the message is formatted
+            lazily by the handlers. The timestamp is the log record's own creation time.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if not self.privacy_settings["log_minimal_data"]:
             return
-            
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "data_type": data_type,
-            "purpose": purpose,
-            "metadata": metadata or {}
-        }
         
-        self.logger.info(f"Data processing: {log_entry}")
+        self.logger.info(
+            "Data processing: data_type=%s purpose=%s metadata=%s",
+            data_type, purpose, metadata or {}
+        )
     
-    def get_compliance_report(self) -> Dict:
+    def get_compliance_report(self) -> Mapping[str, Any]:
         """
         Generate a compliance report.
         
         Returns:
-            Dict: Compliance status and settings
+            Mapping[str, Any]: Compliance status and settings. The report is built once and
+                               shared read-only until a setting changes.
         """
-        return {
-            "gdpr_compliance": {
-                "data_minimization": self.processing_settings["data_minimization"],
-                "purpose_limitation": self.processing_settings["purpose_limitation"],
-                "storage_limitation": self.processing_settings["storage_limitation"],
-                "local_processing": self.processing_settings["local_processing"]
-            },
-            "privacy_settings": self.privacy_settings,
-            "ai_compliance": self.ai_compliance,
-            "retention_periods": self.retention_periods
-        } 
\ No newline at end of file
+        if self._report_cache is None:
+            self._report_cache = MappingProxyType({
+                "gdpr_compliance": MappingProxyType({
+                    "data_minimization": self.processing_settings["data_minimization"],
+                    "purpose_limitation": self.processing_settings["purpose_limitation"],
+                    "storage_limitation": self.processing_settings["storage_limitation"],
+                    "local_processing": self.processing_settings["local_processing"]
+                }),
+                "privacy_settings": MappingProxyType(dict(self.privacy_settings)),
+                "ai_compliance": MappingProxyType(dict(self.ai_compliance)),
+                "retention_periods": MappingProxyType(dict(self.retention_periods))
+            })
+        return self._report_cache
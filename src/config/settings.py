@@ -61,6 +61,5 @@ RAG_CONFIG = {
 
 # Document Processing Configuration
 DOC_PROCESSING_CONFIG = {
-    "supported_formats": [".pdf", ".docx"],
     "max_file_size_mb": 10
 } 
\ No newline at end of file
@@ -1,15 +1,64 @@
-from typing import List, Union
+from typing import Iterator, List, Optional, Union
 from pathlib import Path
-import PyPDF2
+from functools import cache, lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import os
+import threading
+import pypdfium2 as pdfium
 from docx import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from .text_splitter import FastRecursiveTextSplitter
+
+@lru_cache(maxsize=128)
+def _read_cached(reader_name: str, pdf_backend: str, path: str, mtime_ns: int, size: int) -> str:
+    """
+    Extract the text of a document with the named DocumentProcessor reader.
+    
+    Cached on the reader, the PDF backend and the file's path, modification time and size,
+    so re-ingesting an unchanged file skips parsing while an edited file is read again.
+    """
+    return getattr(_text_reader(pdf_backend), reader_name)(Path(path))
+
+@cache
+def _text_reader(pdf_backend: str) -> "DocumentProcessor":
+    """Processor used by _read_cached; text extraction only depends on the PDF backend."""
+    return DocumentProcessor(pdf_backend=pdf_backend)
+
+# PDF text extraction libraries DocumentProcessor can use; both wrap C libraries
+PDF_BACKENDS = ("pdfium", "pymupdf")
+
+# PDFium and MuPDF are not thread-safe, so every call into them goes through this lock.
+# Reentrant, since a PDF generator abandoned mid-document may be finalized while it is held.
+_PDF_LOCK = threading.RLock()
+
+# Batches smaller than this (in total bytes) skip process start-up. PDFs in them are parsed
+# serially, because the PDF libraries are not thread-safe; only other formats use threads.
+PROCESS_POOL_MIN_BYTES = 4 * 1024 * 1024
+
+# Set in worker processes by _init_worker
+_worker_processor: Optional["DocumentProcessor"] = None
+
+def _init_worker(chunk_size: int, chunk_overlap: int, pdf_backend: str) -> None:
+    """Build the worker's own processor once instead of pickling it with every task."""
+    global _worker_processor
+    _worker_processor = DocumentProcessor(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        pdf_backend=pdf_backend
+    )
+
+def _process_in_worker(file_path: Path) -> List[str]:
+    """Process one document in a worker process."""
+    return _worker_processor.process_document(file_path)
 
 class DocumentProcessor:
     """
     A utility class for processing and chunking documents (PDF and DOCX).
     Handles document reading and text splitting for RAG applications.
     """
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, pdf_backend: str = "pdfium",
+                 cache_text: bool = False):
         """
         Initialize the document processor with text splitting configuration.
         
@@ -18,13 +67,84 @@ class DocumentProcessor:
                              Defaults to 1000 characters.
             chunk_overlap (int): Number of characters to overlap between chunks.
                                Defaults to 200 characters.
+            pdf_backend (str): Library used to extract PDF text, "pdfium" (pypdfium2) or
+                               "pymupdf" (requires the pymupdf package). Defaults to "pdfium".
+            cache_text (bool): Keep the extracted text of recently processed files in memory,
+                               keyed on path, modification time and size. Only useful when the
+                               same files are processed again; defaults to False.
+                               
+        Raises:
+            ValueError: If pdf_backend is not supported.
+            ImportError: If the package for pdf_backend is not installed.
         """
-        self.text_splitter = RecursiveCharacterTextSplitter(
+        if pdf_backend not in PDF_BACKENDS:
+            raise ValueError(f"Unsupported PDF backend: {pdf_backend}. Use one of {', '.join(PDF_BACKENDS)}.")
+        if pdf_backend == "pymupdf":
+            try:
+                import fitz  # noqa: F401
+            except ImportError as e:
+                raise ImportError("pdf_backend='pymupdf' requires the pymupdf package: pip install pymupdf") from e
+        self.pdf_backend = pdf_backend
+        self.cache_text = cache_text
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.text_splitter = FastRecursiveTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             length_function=len,
         )
 
+    def iter_pdf_pages(self, file_path: Union[str, Path]) -> Iterator[str]:
+        """
+        Extract the text of a PDF file one page at a time.
+        
+        Args:
+            file_path (Union[str, Path]): Path to the PDF file.
+            
+        Yields:
+            str: The text of each page, with "\n" line breaks.
+            
+        Note:
+            Pages are loaded lazily, so only one page is held in memory at a time.
+            Calls into the PDF library are serialized by a process-wide lock, so this is
+            safe to use from several threads, but PDFs are not parsed in parallel by threads.
+        """
+        if self.pdf_backend == "pymupdf":
+            import fitz
+            
+            with _PDF_LOCK:
+                doc = fitz.open(str(file_path))
+                page_count = doc.page_count
+            try:
+                for index in range(page_count):
+                    with _PDF_LOCK:
+                        page = doc.load_page(index)
+                        text = page.get_text("text")
+                        del page
+                    yield text
+            finally:
+                with _PDF_LOCK:
+                    doc.close()
+            return
+        
+        with _PDF_LOCK:
+            pdf = pdfium.PdfDocument(str(file_path))
+            page_count = len(pdf)
+        try:
+            for index in range(page_count):
+                # Pages are closed explicitly, so they are never finalized outside the lock
+                with _PDF_LOCK:
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                # PDFium reports line breaks as CRLF; normalize to match the splitter separators
+                yield text.replace("\r\n", "\n")
+        finally:
+            with _PDF_LOCK:
+                pdf.close()
+
     def read_pdf(self, file_path: Union[str, Path]) -> str:
         """
         Extract text content from a PDF file.
@@ -36,14 +156,10 @@ class DocumentProcessor:
             str: Extracted text content from the PDF.
             
         Note:
-            This method reads the PDF page by page and concatenates the text.
+            This method reads the PDF page by page with the configured backend (PDFium or
+            MuPDF, both C libraries) and joins the page texts with newlines.
         """
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-        return text
+        return "\n".join(self.iter_pdf_pages(file_path))
 
     def read_docx(self, file_path: Union[str, Path]) -> str:
         """
@@ -56,13 +172,15 @@ class DocumentProcessor:
             str: Extracted text content from the DOCX file.
             
         Note:
-            This method reads the document paragraph by paragraph and adds newlines between them.
+            This method reads the document paragraph by paragraph, ends each one with a newline
+            and joins them in a single pass.
         """
         doc = Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return "".join(f"{paragraph.text}\n" for paragraph in doc.paragraphs)
+
+    # Text extraction method per lower-case file suffix
+    _READERS = {".pdf": read_pdf, ".docx": read_docx}
+    SUPPORTED_FORMATS = frozenset(_READERS)
 
     def process_document(self, file_path: Union[str, Path]) -> List[str]:
         """
@@ -79,18 +197,106 @@ class DocumentProcessor:
             
         Note:
             This method automatically detects the file type and uses the appropriate
-            reader method before splitting the text into chunks.
+            reader method before splitting the text into chunks. With cache_text, extracted
+            text is cached per (path, modification time, size), so unchanged files are only
+            parsed once.
         """
         file_path = Path(file_path)
         
         # Determine file type and extract text accordingly
-        if file_path.suffix.lower() == '.pdf':
-            text = self.read_pdf(file_path)
-        elif file_path.suffix.lower() == '.docx':
-            text = self.read_docx(file_path)
-        else:
+        reader = self._READERS.get(file_path.suffix.lower())
+        if reader is None:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        if self.cache_text:
+            stat = file_path.stat()
+            text = _read_cached(
+                reader.__name__, self.pdf_backend, str(file_path.absolute()), stat.st_mtime_ns, stat.st_size
+            )
+        else:
+            text = reader(self, file_path)
 
         # Split the extracted text into chunks
         chunks = self.text_splitter.split_text(text)
-        return chunks 
\ No newline at end of file
+        return chunks
+
+    def iter_chunks(self, file_path: Union[str, Path]) -> Iterator[str]:
+        """
+        Split a document file into chunks lazily.
+
+        Args:
+            file_path (Union[str, Path]): Path to the document file (PDF or DOCX).
+
+        Yields:
+            str: The text chunks of the document, in order.
+
+        Raises:
+            ValueError: If the file type is not supported (not PDF or DOCX).
+
+        Note:
+            PDFs are read one page at a time and only the last, possibly incomplete chunk is
+            carried over to the next page, so memory stays bounded by about one page regardless
+            of document length. Chunks may therefore break differently around page boundaries
+            than process_document. Other formats are chunked like process_document.
+        """
+        file_path = Path(file_path)
+        if file_path.suffix.lower() != '.pdf':
+            yield from self.process_document(file_path)
+            return
+
+        carry = ""
+        for page_text in self.iter_pdf_pages(file_path):
+            chunks = self.text_splitter.split_text(f"{carry}\n{page_text}" if carry else page_text)
+            if not chunks:
+                continue
+            yield from chunks[:-1]
+            carry = chunks[-1]
+        if carry:
+            yield carry
+
+    def process_documents(self, file_paths: List[Union[str, Path]]) -> List[List[str]]:
+        """
+        Process several document files in parallel.
+        
+        Args:
+            file_paths (List[Union[str, Path]]): Paths to the document files (PDF or DOCX).
+            
+        Returns:
+            List[List[str]]: The chunks of each document, in the order of file_paths.
+            
+        Raises:
+            ValueError: If a file type is not supported (not PDF or DOCX).
+            
+        Note:
+            Parsing is CPU-bound, so large batches are spread over a process pool with one
+            processor per worker. In batches under PROCESS_POOL_MIN_BYTES, PDFs are parsed one
+            after another on the calling thread, since the PDF libraries are not thread-safe,
+            while the other documents are parsed on a thread pool.
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+        if len(paths) <= 1:
+            return [self.process_document(path) for path in paths]
+        
+        workers = min(len(paths), os.cpu_count() or 1)
+        if workers >= 2 and sum(path.stat().st_size for path in paths) >= PROCESS_POOL_MIN_BYTES:
+            # spawn: the parent may already run threads (e.g. Streamlit), which fork does not handle safely
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.chunk_size, self.chunk_overlap, self.pdf_backend)
+            ) as pool:
+                return list(pool.map(_process_in_worker, paths, chunksize=4))
+        
+        results: List[Optional[List[str]]] = [None] * len(paths)
+        pdf_indices = [i for i, path in enumerate(paths) if path.suffix.lower() == '.pdf']
+        other_indices = [i for i, path in enumerate(paths) if path.suffix.lower() != '.pdf']
+        if not other_indices:
+            return [self.process_document(path) for path in paths]
+        
+        with ThreadPoolExecutor(max_workers=min(len(other_indices), 8)) as pool:
+            futures = [(i, pool.submit(self.process_document, paths[i])) for i in other_indices]
+            for i in pdf_indices:
+                results[i] = self.process_document(paths[i])
+            for i, future in futures:
+                results[i] = future.result()
+        return results
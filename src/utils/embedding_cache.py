@@ -0,0 +1,137 @@
+"""
+Embedding cache for the RAG pipeline.
+Serves repeated texts from an in-memory LRU or an on-disk store instead of
+running the embedding model again.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+def text_key(text: str, namespace: str = "") -> str:
+    """Return the SHA-256 hex digest used as cache key for a text."""
+    return hashlib.sha256(f"{namespace}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache of embedding vectors keyed by SHA-256 digests.
+    The first tier is an in-memory LRU, the second an optional directory of .npy files
+    that survives process restarts.
+    """
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, maxsize: int = 4096):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            cache_dir (Optional[Union[str, Path]]): Directory for the on-disk tier.
+                                                   Defaults to None (memory only).
+            maxsize (int): Maximum number of vectors kept in memory. Defaults to 4096.
+        """
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.npy"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached vector for a key, or None on a miss."""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                return vector
+
+        if self.cache_dir is None:
+            return None
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            vector = np.load(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache entry {path}: {str(e)}")
+            return None
+
+        self._remember(key, vector)
+        return vector
+
+    def put(self, key: str, vector: Union[List[float], np.ndarray]) -> None:
+        """Store a vector in both cache tiers."""
+        vector = np.asarray(vector, dtype=np.float32)
+        self._remember(key, vector)
+
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            np.save(path, vector)
+        except OSError as e:
+            logger.warning(f"Failed to write embedding cache entry {path}: {str(e)}")
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain embeddings wrapper that consults an EmbeddingCache before calling the model.
+    Cache misses of a single embed_documents call are encoded together in one batch.
+    """
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, namespace: str = ""):
+        """
+        Initialize the cached embeddings wrapper.
+
+        Args:
+            embeddings (Embeddings): The underlying embedding model.
+            cache (EmbeddingCache): Cache used to store computed vectors.
+            namespace (str): Prefix mixed into every key, e.g. the model name,
+                             so vectors from different models never collide.
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.namespace = namespace
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents, encoding only the texts not found in the cache."""
+        keys = [text_key(text, f"{self.namespace}:doc") for text in texts]
+        vectors: List[Optional[np.ndarray]] = [self.cache.get(key) for key in keys]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            logger.debug(f"Embedding cache miss for {len(missing)} of {len(texts)} documents")
+            computed = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, computed):
+                self.cache.put(keys[i], vector)
+                vectors[i] = np.asarray(vector, dtype=np.float32)
+
+        return [vector.tolist() for vector in vectors]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, returning the cached vector when available."""
+        key = text_key(text, f"{self.namespace}:query")
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self.cache.put(key, vector)
+            return list(vector)
+        return vector.tolist()
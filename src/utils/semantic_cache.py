@@ -0,0 +1,126 @@
+"""
+Semantic response cache for the RAG system.
+Returns a previously generated LLM answer when a new query is a near-duplicate
+(by cosine similarity of query embeddings) of one already answered.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+
+from .vector_ops import normalize, top_k_cosine
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Cache of (query embedding, response text) pairs searched by cosine similarity.
+    Entries are grouped by namespace (e.g. a fingerprint of the prompt context) so that
+    an answer is only reused for the same documents it was generated from.
+    """
+    def __init__(self,
+                 path: Optional[Union[str, Path]] = None,
+                 threshold: float = 0.95,
+                 maxsize: int = 1024):
+        """
+        Initialize the semantic cache, loading persisted entries if present.
+
+        Args:
+            path (Optional[Union[str, Path]]): File used to persist the cache between sessions.
+                                              Defaults to None (in-memory only).
+            threshold (float): Minimum cosine similarity for a cache hit. Defaults to 0.95.
+            maxsize (int): Maximum number of entries; the oldest are evicted first.
+        """
+        self.path = Path(path).expanduser() if path else None
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._embeddings: Optional[np.ndarray] = None
+        self._responses: List[str] = []
+        self._namespaces: List[str] = []
+        self._lock = threading.Lock()
+
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def lookup(self, embedding: Union[List[float], np.ndarray], namespace: str = "") -> Optional[str]:
+        """
+        Find a cached response for a query embedding.
+
+        Args:
+            embedding (Union[List[float], np.ndarray]): Embedding of the query.
+            namespace (str): Namespace the response must belong to.
+
+        Returns:
+            Optional[str]: The cached response text, or None on a miss.
+        """
+        query = normalize(embedding)
+        with self._lock:
+            candidates = [i for i, ns in enumerate(self._namespaces) if ns == namespace]
+            if not candidates:
+                return None
+            top, scores = top_k_cosine(query, self._embeddings[candidates], k=1)
+            if scores[0] < self.threshold:
+                return None
+            logger.info(f"Semantic cache hit (similarity={scores[0]:.3f})")
+            return self._responses[candidates[top[0]]]
+
+    def insert(self, embedding: Union[List[float], np.ndarray], response_text: str, namespace: str = "") -> None:
+        """
+        Add a response to the cache and persist it if a path is configured.
+
+        Args:
+            embedding (Union[List[float], np.ndarray]): Embedding of the query.
+            response_text (str): The generated response.
+            namespace (str): Namespace the response belongs to.
+        """
+        vector = normalize(embedding)[np.newaxis, :]
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = vector
+            else:
+                self._embeddings = np.vstack([self._embeddings, vector])
+            self._responses.append(response_text)
+            self._namespaces.append(namespace)
+
+            overflow = len(self._responses) - self.maxsize
+            if overflow > 0:
+                self._embeddings = self._embeddings[overflow:]
+                del self._responses[:overflow]
+                del self._namespaces[:overflow]
+
+            if self.path is not None:
+                self._save()
+
+    def _load(self) -> None:
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self._embeddings = data["embeddings"].astype(np.float32)
+                self._responses = data["responses"].tolist()
+                self._namespaces = data["namespaces"].tolist()
+            logger.info(f"Loaded {len(self._responses)} semantic cache entries from {self.path}")
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable semantic cache {self.path}: {str(e)}")
+            self._embeddings, self._responses, self._namespaces = None, [], []
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    embeddings=self._embeddings,
+                    responses=np.array(self._responses, dtype=str),
+                    namespaces=np.array(self._namespaces, dtype=str)
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist semantic cache to {self.path}: {str(e)}")
@@ -0,0 +1,130 @@
+"""
+Drop-in replacement for LangChain's RecursiveCharacterTextSplitter.
+Produces the same chunks, but compiles the separator patterns once instead of
+on every call and merges pieces with deques instead of repeatedly slicing lists.
+"""
+
+import logging
+import re
+from collections import deque
+from typing import Any, Iterable, List
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+logger = logging.getLogger(__name__)
+
+
+class FastRecursiveTextSplitter(RecursiveCharacterTextSplitter):
+    """
+    RecursiveCharacterTextSplitter with precompiled separators.
+    Separators are always treated as literal strings.
+    """
+
+    def __init__(self, **kwargs: Any):
+        """
+        Initialize the splitter.
+
+        Args:
+            **kwargs: Same arguments as RecursiveCharacterTextSplitter,
+                      except is_separator_regex, which is not supported.
+        """
+        if kwargs.get("is_separator_regex"):
+            raise ValueError("FastRecursiveTextSplitter only supports literal separators")
+        super().__init__(**kwargs)
+        # (search pattern, capturing split pattern) per non-empty separator
+        self._patterns = {
+            separator: (re.compile(re.escape(separator)), re.compile(f"({re.escape(separator)})"))
+            for separator in self._separators
+            if separator
+        }
+
+    def _split_with_separator(self, text: str, separator: str) -> List[str]:
+        """Split text on a separator, attaching it to the pieces like LangChain does."""
+        if not separator:
+            return list(text)
+        if not self._keep_separator:
+            return [s for s in self._patterns[separator][0].split(text) if s]
+
+        parts = self._patterns[separator][1].split(text)
+        if self._keep_separator == "end":
+            splits = [parts[i] + parts[i + 1] for i in range(0, len(parts) - 1, 2)]
+            if len(parts) % 2 == 0:
+                splits += parts[-1:]
+            splits.append(parts[-1])
+        else:
+            splits = [parts[i] + parts[i + 1] for i in range(1, len(parts), 2)]
+            if len(parts) % 2 == 0:
+                splits += parts[-1:]
+            splits.insert(0, parts[0])
+        return [s for s in splits if s]
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        """Split incoming text and return chunks."""
+        final_chunks = []
+        # Use the first separator present in the text
+        separator = separators[-1]
+        new_separators = []
+        for i, candidate in enumerate(separators):
+            if not candidate:
+                separator = candidate
+                break
+            if self._patterns[candidate][0].search(text):
+                separator = candidate
+                new_separators = separators[i + 1:]
+                break
+
+        splits = self._split_with_separator(text, separator)
+
+        # Merge the small pieces, recursively splitting the ones that are too long
+        good_splits = []
+        merge_separator = "" if self._keep_separator else separator
+        for s in splits:
+            if self._length_function(s) < self._chunk_size:
+                good_splits.append(s)
+            else:
+                if good_splits:
+                    final_chunks.extend(self._merge_splits(good_splits, merge_separator))
+                    good_splits = []
+                if not new_separators:
+                    final_chunks.append(s)
+                else:
+                    final_chunks.extend(self._split_text(s, new_separators))
+        if good_splits:
+            final_chunks.extend(self._merge_splits(good_splits, merge_separator))
+        return final_chunks
+
+    def _merge_splits(self, splits: Iterable[str], separator: str) -> List[str]:
+        """Combine small pieces into chunks of up to chunk_size with chunk_overlap."""
+        separator_len = self._length_function(separator)
+
+        docs = []
+        current_doc: deque = deque()
+        lengths: deque = deque()
+        total = 0
+        for d in splits:
+            d_len = self._length_function(d)
+            if total + d_len + (separator_len if current_doc else 0) > self._chunk_size:
+                if total > self._chunk_size:
+                    logger.warning(
+                        f"Created a chunk of size {total}, "
+                        f"which is longer than the specified {self._chunk_size}"
+                    )
+                if current_doc:
+                    doc = self._join_docs(list(current_doc), separator)
+                    if doc is not None:
+                        docs.append(doc)
+                    # Drop pieces from the front until only the overlap is left
+                    # and the next piece fits
+                    while total > self._chunk_overlap or (
+                        total + d_len + (separator_len if current_doc else 0) > self._chunk_size
+                        and total > 0
+                    ):
+                        total -= lengths.popleft() + (separator_len if len(current_doc) > 1 else 0)
+                        current_doc.popleft()
+            current_doc.append(d)
+            lengths.append(d_len)
+            total += d_len + (separator_len if len(current_doc) > 1 else 0)
+        doc = self._join_docs(list(current_doc), separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
@@ -0,0 +1,104 @@
+"""
+Vectorized similarity helpers shared by the retrieval and caching code.
+All functions operate on contiguous float32 NumPy arrays so the heavy lifting
+is done by BLAS rather than Python loops.
+"""
+
+from typing import List, Tuple, Union
+
+import numpy as np
+
+
+def normalize(vectors: Union[List[float], List[List[float]], np.ndarray]) -> np.ndarray:
+    """
+    L2-normalize a vector or each row of a matrix.
+
+    Args:
+        vectors: A single vector of shape (d,) or a matrix of shape (n, d).
+
+    Returns:
+        np.ndarray: float32 array of the same shape with unit-length rows.
+                    Zero rows are returned unchanged.
+    """
+    array = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return array / norms
+
+
+def top_k_cosine(query: np.ndarray, matrix: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows of a matrix most similar to a query.
+
+    Args:
+        query (np.ndarray): Normalized query vector of shape (d,).
+        matrix (np.ndarray): Normalized candidate matrix of shape (n, d).
+        k (int): Number of results to return.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Row indices and cosine scores, best first.
+    """
+    if matrix.shape[0] == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    scores = matrix @ query
+    k = min(k, scores.shape[0])
+    # argpartition is O(n); only the k survivors are sorted
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    return top, scores[top]
+
+
+def quantize_int8(vectors: Union[List[float], List[List[float]], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetrically quantize a vector or each row of a matrix to int8.
+
+    Each row is scaled by 127 / max(|row|), so row ≈ q / scale.
+
+    Args:
+        vectors: A single vector of shape (d,) or a matrix of shape (n, d).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The int8 values and the float32 per-row scales.
+    """
+    array = np.asarray(vectors, dtype=np.float32)
+    peak = np.abs(array).max(axis=-1, keepdims=True)
+    peak[peak == 0] = 1.0
+    scales = (127.0 / peak).astype(np.float32)
+    quantized = np.round(array * scales).astype(np.int8)
+    return quantized, np.squeeze(scales, axis=-1)
+
+
+def top_k_cosine_int8(query: np.ndarray, matrix: np.ndarray, scales: np.ndarray, k: int,
+                      block_rows: int = 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows of an int8-quantized matrix most similar to a query.
+
+    The matrix is dequantized block by block, so the float32 temporaries stay
+    cache-sized while the stored index is a quarter of its float32 size.
+
+    Args:
+        query (np.ndarray): Normalized float32 query vector of shape (d,).
+        matrix (np.ndarray): int8 matrix of shape (n, d), as returned by quantize_int8
+                             for normalized rows.
+        scales (np.ndarray): float32 per-row scales of shape (n,), as returned by quantize_int8.
+        k (int): Number of results to return.
+        block_rows (int): Rows dequantized at a time. Defaults to 1024.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Row indices and approximate cosine scores, best first.
+    """
+    if matrix.shape[0] == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    query = np.asarray(query, dtype=np.float32)
+    scores = np.empty(matrix.shape[0], dtype=np.float32)
+    for start in range(0, matrix.shape[0], block_rows):
+        block = matrix[start:start + block_rows]
+        scores[start:start + block.shape[0]] = block.astype(np.float32) @ query
+    scores /= scales
+
+    k = min(k, scores.shape[0])
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    return top, scores[top]
@@ -0,0 +1,101 @@
+"""
+Tests for the document processor.
+"""
+
+import pytest
+from docx import Document
+from fpdf import FPDF
+from src.utils import document_processor
+from src.utils.document_processor import DocumentProcessor
+
+def make_pdf(path, label, pages=2):
+    """Write a PDF whose pages mention the label."""
+    pdf = FPDF()
+    for page in range(pages):
+        pdf.add_page()
+        pdf.set_font("Arial", "", 12)
+        pdf.multi_cell(0, 10, " ".join(f"{label} page {page} sentence {i}." for i in range(60)))
+    pdf.output(str(path))
+    return path
+
+def make_docx(path, label):
+    """Write a DOCX file whose paragraphs mention the label."""
+    doc = Document()
+    for i in range(5):
+        doc.add_paragraph(f"{label} paragraph {i}.")
+    doc.save(str(path))
+    return path
+
+def make_mixed_files(tmp_path):
+    """Write PDF and DOCX files in an interleaved order."""
+    return [
+        make_pdf(tmp_path / "a.pdf", "alpha"),
+        make_docx(tmp_path / "b.docx", "bravo"),
+        make_pdf(tmp_path / "c.pdf", "charlie", pages=1),
+        make_docx(tmp_path / "d.docx", "delta"),
+        make_pdf(tmp_path / "e.pdf", "echo", pages=3),
+    ]
+
+def test_process_document_pdf(tmp_path):
+    """Test that PDF text is extracted and chunked."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    chunks = processor.process_document(make_pdf(tmp_path / "a.pdf", "alpha"))
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert "alpha page 1" in " ".join(chunks)
+
+def test_process_document_docx(tmp_path):
+    """Test that DOCX text is extracted."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    chunks = processor.process_document(make_docx(tmp_path / "b.docx", "bravo"))
+    assert "bravo paragraph 4." in " ".join(chunks)
+
+def test_process_document_unsupported(tmp_path):
+    """Test that unsupported file types are rejected."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    path = tmp_path / "notes.txt"
+    path.write_text("text")
+    with pytest.raises(ValueError):
+        processor.process_document(path)
+
+def test_text_cache_is_opt_in(tmp_path):
+    """Test that extracted text is only cached when requested."""
+    path = make_pdf(tmp_path / "a.pdf", "alpha")
+    document_processor._read_cached.cache_clear()
+    DocumentProcessor().process_document(path)
+    assert document_processor._read_cached.cache_info().currsize == 0
+
+    DocumentProcessor(cache_text=True).process_document(path)
+    DocumentProcessor(cache_text=True).process_document(path)
+    assert document_processor._read_cached.cache_info().hits == 1
+
+def test_process_documents_preserves_order(tmp_path):
+    """Test that results follow the input order across PDFs and DOCX files."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    mixed_files = make_mixed_files(tmp_path)
+    results = processor.process_documents(mixed_files)
+    assert results == [processor.process_document(path) for path in mixed_files]
+
+def test_process_documents_process_pool_preserves_order(tmp_path, monkeypatch):
+    """Test that the process pool path also keeps the input order."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    mixed_files = make_mixed_files(tmp_path)
+    monkeypatch.setattr(document_processor, "PROCESS_POOL_MIN_BYTES", 0)
+    monkeypatch.setattr(document_processor.os, "cpu_count", lambda: 2)
+    results = processor.process_documents(mixed_files)
+    assert results == [processor.process_document(path) for path in mixed_files]
+
+def test_process_documents_empty_and_single(tmp_path):
+    """Test the trivial batch sizes."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    mixed_files = make_mixed_files(tmp_path)
+    assert processor.process_documents([]) == []
+    assert processor.process_documents(mixed_files[:1]) == [processor.process_document(mixed_files[0])]
+
+def test_iter_chunks_covers_all_pages(tmp_path):
+    """Test that streamed PDF chunks contain the text of every page."""
+    processor = DocumentProcessor(chunk_size=200, chunk_overlap=20)
+    path = make_pdf(tmp_path / "e.pdf", "echo", pages=3)
+    text = " ".join(processor.iter_chunks(path))
+    for page in range(3):
+        assert f"echo page {page} sentence 59." in text
@@ -0,0 +1,78 @@
+"""
+Tests for the embedding cache and the cached embeddings wrapper.
+"""
+
+import numpy as np
+from unittest.mock import MagicMock
+from src.utils.embedding_cache import CachedEmbeddings, EmbeddingCache, text_key
+
+def make_model():
+    """Create a mock embedding model returning one vector per text."""
+    model = MagicMock()
+    model.embed_documents.side_effect = lambda texts: [[float(len(text)), 1.0] for text in texts]
+    model.embed_query.side_effect = lambda text: [float(len(text)), 2.0]
+    return model
+
+def test_text_key_namespaced():
+    """Test that the namespace changes the key."""
+    assert text_key("a") == text_key("a")
+    assert text_key("a", "model-1") != text_key("a", "model-2")
+
+def test_get_put_memory():
+    """Test storing and reading a vector from memory."""
+    cache = EmbeddingCache()
+    assert cache.get("k") is None
+    cache.put("k", [1.0, 2.0])
+    np.testing.assert_array_equal(cache.get("k"), np.array([1.0, 2.0], dtype=np.float32))
+
+def test_lru_eviction():
+    """Test that the least recently used vector is evicted first."""
+    cache = EmbeddingCache(maxsize=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.get("a")
+    cache.put("c", [3.0])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    """Test that vectors written to disk are found by a new cache."""
+    EmbeddingCache(cache_dir=tmp_path).put("k", [1.0, 2.0])
+    np.testing.assert_array_equal(EmbeddingCache(cache_dir=tmp_path).get("k"), [1.0, 2.0])
+
+def test_unreadable_disk_entry_is_a_miss(tmp_path):
+    """Test that a corrupt cache file is ignored."""
+    cache = EmbeddingCache(cache_dir=tmp_path)
+    path = cache._path("abcdef")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a numpy file")
+    assert cache.get("abcdef") is None
+
+def test_embed_documents_only_computes_misses():
+    """Test that cached texts are skipped and misses are embedded in one batch."""
+    model = make_model()
+    embeddings = CachedEmbeddings(model, EmbeddingCache(), namespace="m")
+    first = embeddings.embed_documents(["a", "bb"])
+    second = embeddings.embed_documents(["bb", "ccc", "a", "dddd"])
+
+    assert first == [[1.0, 1.0], [2.0, 1.0]]
+    assert second == [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0], [4.0, 1.0]]
+    assert model.embed_documents.call_count == 2
+    model.embed_documents.assert_called_with(["ccc", "dddd"])
+
+def test_embed_query_cached():
+    """Test that repeated queries hit the cache."""
+    model = make_model()
+    embeddings = CachedEmbeddings(model, EmbeddingCache(), namespace="m")
+    assert embeddings.embed_query("abc") == [3.0, 2.0]
+    assert embeddings.embed_query("abc") == [3.0, 2.0]
+    model.embed_query.assert_called_once_with("abc")
+
+def test_queries_and_documents_cached_separately():
+    """Test that a query never reuses the document vector of the same text."""
+    model = make_model()
+    embeddings = CachedEmbeddings(model, EmbeddingCache(), namespace="m")
+    embeddings.embed_documents(["abc"])
+    assert embeddings.embed_query("abc") == [3.0, 2.0]
+    model.embed_query.assert_called_once_with("abc")
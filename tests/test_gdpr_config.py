@@ -0,0 +1,71 @@
+"""
+Tests for the GDPR and EU AI compliance configuration.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from src.config.gdpr_config import GDPRConfig
+
+def test_validate_processing_default():
+    """Test that the default settings are compliant."""
+    config = GDPRConfig()
+    assert config.validate_processing("user_queries", "retrieval") is True
+
+@pytest.mark.parametrize("key", ["data_minimization", "local_processing"])
+def test_validate_processing_after_update_setting(key):
+    """Test that disabling a required setting fails validation, and enabling it again passes."""
+    config = GDPRConfig()
+    config.update_setting("processing_settings", key, False)
+    assert config.validate_processing("user_queries", "retrieval") is False
+    config.update_setting("processing_settings", key, True)
+    assert config.validate_processing("user_queries", "retrieval") is True
+
+def test_settings_are_read_only():
+    """Test that settings cannot be changed behind update_setting's back."""
+    config = GDPRConfig()
+    with pytest.raises(TypeError):
+        config.processing_settings["local_processing"] = False
+    assert config.validate_processing("user_queries", "retrieval") is True
+
+def test_update_setting_unknown_section():
+    """Test that an unknown section is rejected."""
+    config = GDPRConfig()
+    with pytest.raises(ValueError):
+        config.update_setting("unknown", "key", True)
+
+def test_compliance_report_cached_and_invalidated():
+    """Test that the report is reused until a setting changes."""
+    config = GDPRConfig()
+    report = config.get_compliance_report()
+    assert config.get_compliance_report() is report
+    with pytest.raises(TypeError):
+        report["gdpr_compliance"] = {}
+
+    config.update_setting("privacy_settings", "anonymize_queries", False)
+    updated = config.get_compliance_report()
+    assert updated is not report
+    assert updated["privacy_settings"]["anonymize_queries"] is False
+
+def test_retention_dates():
+    """Test retention dates for known and unknown data types."""
+    config = GDPRConfig()
+    before = datetime.now()
+    dates = config.get_retention_dates(["processing_logs", "unknown"])
+    after = datetime.now()
+    assert before + timedelta(days=90) <= dates["processing_logs"] <= after + timedelta(days=90)
+    assert dates["unknown"] - dates["processing_logs"] == timedelta(days=30) - timedelta(days=90)
+
+def test_retention_date_follows_update_setting():
+    """Test that changed retention periods are used."""
+    config = GDPRConfig()
+    config.update_setting("retention_periods", "user_queries", 7)
+    assert abs(config.get_retention_date("user_queries") - (datetime.now() + timedelta(days=7))) < timedelta(seconds=5)
+
+def test_log_processing_includes_fields(caplog):
+    """Test that the audit log message contains the processing details."""
+    config = GDPRConfig()
+    with caplog.at_level(logging.INFO, logger="src.config.gdpr_config"):
+        config.log_processing("user_queries", "retrieval", {"chunks": 3})
+    assert "data_type=user_queries purpose=retrieval metadata={'chunks': 3}" in caplog.text
@@ -0,0 +1,115 @@
+"""
+Tests for write buffering and chunk deduplication in the RAG pipelines.
+"""
+
+import hashlib
+import sqlite3
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+from langchain_core.embeddings import Embeddings
+
+pytest.importorskip("torch")
+pytest.importorskip("chromadb")
+
+from src.components import rag_pipeline
+from src.components.rag_pipeline import EMBEDDING_DIMENSION, RAGPipeline, SqliteVecRAGPipeline
+
+class HashEmbeddings(Embeddings):
+    """Deterministic embeddings derived from the text hash, recording every embedded text."""
+    def __init__(self):
+        self.embedded = []
+
+    def _vector(self, text):
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        return np.random.default_rng(seed).standard_normal(EMBEDDING_DIMENSION).tolist()
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+@pytest.fixture
+def embeddings():
+    """Patch the pipelines to use deterministic test embeddings."""
+    model = HashEmbeddings()
+    with patch.object(rag_pipeline, "_create_embeddings", return_value=model):
+        yield model
+
+def make_sqlite_vec(tmp_path):
+    """Create a sqlite-vec pipeline in a temporary database, skipping if sqlite-vec cannot load."""
+    pytest.importorskip("sqlite_vec")
+    if not hasattr(sqlite3.Connection, "enable_load_extension"):
+        pytest.skip("sqlite3 was built without extension loading")
+    return SqliteVecRAGPipeline(db_path=str(tmp_path / "rag.sqlite3"))
+
+def test_chroma_buffers_until_flush(tmp_path, embeddings):
+    """Test that added chunks are only embedded and stored on flush."""
+    pipeline = RAGPipeline(persist_directory=str(tmp_path / "chroma"))
+    pipeline.add_documents(["alpha", "beta"], [{"source": "a"}] * 2)
+    assert embeddings.embedded == []
+    assert pipeline.get_stats()["total_documents"] == 0
+
+    pipeline.flush()
+    assert sorted(embeddings.embedded) == ["alpha", "beta"]
+    assert pipeline.get_stats()["total_documents"] == 2
+
+def test_chroma_flushes_full_buffer(tmp_path, embeddings, monkeypatch):
+    """Test that add_documents writes the buffer once it is full."""
+    monkeypatch.setattr(rag_pipeline, "FLUSH_DOCS", 2)
+    pipeline = RAGPipeline(persist_directory=str(tmp_path / "chroma"))
+    pipeline.add_documents(["alpha"], [{"source": "a"}])
+    assert pipeline.get_stats()["total_documents"] == 0
+    pipeline.add_documents(["beta"], [{"source": "a"}])
+    assert pipeline.get_stats()["total_documents"] == 2
+
+def test_chroma_query_reads_buffered_writes(tmp_path, embeddings):
+    """Test that a query sees chunks that were added but not flushed yet."""
+    pipeline = RAGPipeline(persist_directory=str(tmp_path / "chroma"))
+    pipeline.add_documents(["alpha", "beta"], [{"source": "a"}] * 2)
+    assert pipeline.query("alpha", k=1)[0].page_content == "alpha"
+
+def test_chroma_dedups_within_batch(tmp_path, embeddings):
+    """Test that a chunk repeated in one batch is stored once."""
+    pipeline = RAGPipeline(persist_directory=str(tmp_path / "chroma"))
+    pipeline.add_documents(["alpha", "beta", "alpha"], [{"source": "a"}] * 3)
+    pipeline.flush()
+    assert pipeline.get_stats()["total_documents"] == 2
+    assert sorted(embeddings.embedded) == ["alpha", "beta"]
+
+def test_chroma_skips_stored_chunks(tmp_path, embeddings):
+    """Test that re-uploaded chunks are neither embedded nor stored again."""
+    pipeline = RAGPipeline(persist_directory=str(tmp_path / "chroma"))
+    pipeline.add_documents(["alpha", "beta"], [{"source": "a"}] * 2)
+    pipeline.flush()
+    pipeline.add_documents(["beta", "gamma"], [{"source": "b"}] * 2)
+    pipeline.flush()
+    assert pipeline.get_stats()["total_documents"] == 3
+    assert embeddings.embedded.count("beta") == 1
+
+def test_sqlite_vec_dedups_within_batch(tmp_path, embeddings):
+    """Test that a chunk repeated in one batch is stored once."""
+    pipeline = make_sqlite_vec(tmp_path)
+    pipeline.add_documents(["alpha", "beta", "alpha"], [{"source": "a"}] * 3)
+    assert pipeline.get_stats()["total_documents"] == 2
+    assert sorted(embeddings.embedded) == ["alpha", "beta"]
+
+def test_sqlite_vec_skips_stored_chunks(tmp_path, embeddings):
+    """Test that re-uploaded chunks are neither embedded nor stored again."""
+    pipeline = make_sqlite_vec(tmp_path)
+    pipeline.add_documents(["alpha", "beta"], [{"source": "a"}] * 2)
+    pipeline.add_documents(["beta", "gamma"], [{"source": "b"}] * 2)
+    assert pipeline.get_stats()["total_documents"] == 3
+    assert embeddings.embedded.count("beta") == 1
+    assert pipeline.query("gamma", k=1)[0].metadata == {"source": "b"}
+
+def test_sqlite_vec_clear_forgets_hashes(tmp_path, embeddings):
+    """Test that chunks can be added again after clearing the store."""
+    pipeline = make_sqlite_vec(tmp_path)
+    pipeline.add_documents(["alpha"], [{"source": "a"}])
+    pipeline.clear()
+    pipeline.add_documents(["alpha"], [{"source": "a"}])
+    assert pipeline.get_stats()["total_documents"] == 1
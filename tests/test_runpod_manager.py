@@ -0,0 +1,101 @@
+"""
+Tests for the RunPod pod manager.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.components import runpod_manager
+from src.components.runpod_manager import POLL_SCHEDULE, RunPodManager
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Create a RunPod manager with test credentials."""
+    monkeypatch.setenv("RUNPOD_API_KEY", "test-key")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "abcdefgh1234")
+    manager = RunPodManager()
+    yield manager
+    manager.close()
+
+def pod_response(status):
+    """Create a mock GET /pods/{id} response."""
+    response = MagicMock()
+    response.json.return_value = {"id": "abcdefgh1234", "desiredStatus": status}
+    return response
+
+def test_invalid_endpoint_id(monkeypatch):
+    """Test that malformed endpoint ids are rejected."""
+    monkeypatch.setenv("RUNPOD_API_KEY", "test-key")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "bad-id")
+    with pytest.raises(ValueError):
+        RunPodManager()
+
+def test_pod_status_reused_within_ttl(manager):
+    """Test that a fresh pod record is served from the cache."""
+    with patch.object(manager._session, "get", return_value=pod_response("RUNNING")) as mock_get:
+        assert manager.get_pod_status() == "RUNNING"
+        assert manager.get_pod_details()["desiredStatus"] == "RUNNING"
+    mock_get.assert_called_once()
+
+def test_pod_status_refetched_after_ttl(manager):
+    """Test that an expired pod record is fetched again."""
+    with patch.object(manager._session, "get", side_effect=[pod_response("STARTING"), pod_response("RUNNING")]) as mock_get, \
+         patch.object(runpod_manager.time, "monotonic", side_effect=[100.0, 100.0 + runpod_manager.POD_CACHE_TTL + 1]):
+        assert manager.get_pod_status() == "STARTING"
+        assert manager.get_pod_status() == "RUNNING"
+    assert mock_get.call_count == 2
+
+def test_pod_status_ttl_zero_forces_request(manager):
+    """Test that ttl=0 bypasses the cache."""
+    with patch.object(manager._session, "get", return_value=pod_response("RUNNING")) as mock_get:
+        manager.get_pod_status()
+        manager.get_pod_status(0)
+    assert mock_get.call_count == 2
+
+def test_start_pod_clears_cache(manager):
+    """Test that starting the pod invalidates the cached record."""
+    with patch.object(manager._session, "get", return_value=pod_response("EXITED")) as mock_get, \
+         patch.object(manager._session, "post") as mock_post:
+        manager.get_pod_status()
+        manager.start_pod()
+        manager.get_pod_status()
+    mock_post.return_value.json.assert_not_called()
+    assert mock_get.call_count == 2
+
+def test_pod_details_is_a_copy(manager):
+    """Test that callers cannot modify the cached record."""
+    with patch.object(manager._session, "get", return_value=pod_response("RUNNING")):
+        manager.get_pod_details()["desiredStatus"] = "CHANGED"
+        assert manager.get_pod_status() == "RUNNING"
+
+def test_wait_for_pod_follows_poll_schedule(manager):
+    """Test that polls back off along POLL_SCHEDULE until Ollama is ready."""
+    statuses = iter(["STARTING", "STARTING", "RUNNING", "RUNNING", "RUNNING"])
+    ollama = iter([False, False, False, False, True])
+    with patch.object(manager, "get_pod_status", side_effect=lambda ttl=0: next(statuses)), \
+         patch.object(manager, "check_ollama_status", side_effect=lambda: next(ollama)), \
+         patch.object(runpod_manager.time, "sleep") as mock_sleep:
+        assert manager.wait_for_pod(timeout=300) is True
+    assert [call.args[0] for call in mock_sleep.call_args_list] == list(POLL_SCHEDULE[:4])
+
+def test_wait_for_pod_times_out(manager):
+    """Test that waiting stops at the timeout."""
+    clock = iter([0.0, 0.5, 10.0])
+    with patch.object(manager, "get_pod_status", return_value="STARTING"), \
+         patch.object(manager, "check_ollama_status", return_value=False), \
+         patch.object(runpod_manager.time, "monotonic", side_effect=lambda: next(clock)), \
+         patch.object(runpod_manager.time, "sleep") as mock_sleep:
+        assert manager.wait_for_pod(timeout=5) is False
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [POLL_SCHEDULE[0]]
+
+def test_wait_for_pod_fails_fast(manager):
+    """Test that a failed pod returns without sleeping."""
+    with patch.object(manager, "get_pod_status", return_value="FAILED"), \
+         patch.object(manager, "check_ollama_status", return_value=False), \
+         patch.object(runpod_manager.time, "sleep") as mock_sleep:
+        assert manager.wait_for_pod(timeout=300) is False
+    mock_sleep.assert_not_called()
+
+def test_ollama_check_does_not_retry(manager):
+    """Test that the Ollama health check uses an adapter without retries."""
+    adapter = manager._session.get_adapter(f"{manager.get_ollama_url()}/api/tags")
+    assert adapter.max_retries.total == 0
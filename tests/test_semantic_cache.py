@@ -0,0 +1,63 @@
+"""
+Tests for the semantic response cache.
+"""
+
+import numpy as np
+from src.utils.semantic_cache import SemanticCache
+
+def test_lookup_empty():
+    """Test a lookup on an empty cache."""
+    cache = SemanticCache(threshold=0.95)
+    assert cache.lookup([1.0, 0.0]) is None
+
+def test_hit_above_threshold():
+    """Test that a near-duplicate query returns the cached response."""
+    cache = SemanticCache(threshold=0.95)
+    cache.insert([1.0, 0.0], "answer")
+    assert cache.lookup([1.0, 0.1]) == "answer"
+
+def test_miss_below_threshold():
+    """Test that a dissimilar query is a miss."""
+    cache = SemanticCache(threshold=0.95)
+    cache.insert([1.0, 0.0], "answer")
+    # cosine similarity of about 0.89
+    assert cache.lookup([1.0, 0.5]) is None
+
+def test_best_match_returned():
+    """Test that the most similar entry wins."""
+    cache = SemanticCache(threshold=0.95)
+    cache.insert([1.0, 0.0], "first")
+    cache.insert([1.0, 0.2], "second")
+    assert cache.lookup([1.0, 0.19]) == "second"
+
+def test_namespace_isolation():
+    """Test that responses are only reused within their namespace."""
+    cache = SemanticCache(threshold=0.95)
+    cache.insert([1.0, 0.0], "answer", namespace="docs-a")
+    assert cache.lookup([1.0, 0.0], namespace="docs-b") is None
+    assert cache.lookup([1.0, 0.0]) is None
+    assert cache.lookup([1.0, 0.0], namespace="docs-a") == "answer"
+
+def test_maxsize_evicts_oldest():
+    """Test that the oldest entries are evicted first."""
+    cache = SemanticCache(maxsize=2)
+    cache.insert([1.0, 0.0, 0.0], "x")
+    cache.insert([0.0, 1.0, 0.0], "y")
+    cache.insert([0.0, 0.0, 1.0], "z")
+    assert len(cache) == 2
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+    assert cache.lookup([0.0, 0.0, 1.0]) == "z"
+
+def test_persistence_round_trip(tmp_path):
+    """Test that entries are reloaded from disk."""
+    path = tmp_path / "cache.npz"
+    SemanticCache(path=path).insert(np.array([0.0, 1.0]), "saved", namespace="ns")
+    reloaded = SemanticCache(path=path)
+    assert len(reloaded) == 1
+    assert reloaded.lookup([0.0, 1.0], namespace="ns") == "saved"
+
+def test_unreadable_file_ignored(tmp_path):
+    """Test that a corrupt cache file starts an empty cache."""
+    path = tmp_path / "cache.npz"
+    path.write_bytes(b"garbage")
+    assert len(SemanticCache(path=path)) == 0
@@ -0,0 +1,52 @@
+"""
+Tests for the precompiled recursive text splitter.
+"""
+
+import pytest
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from src.utils.text_splitter import FastRecursiveTextSplitter
+
+PARAGRAPH = (
+    "Lessee shall maintain comprehensive insurance coverage. "
+    "Late payment fee of 5% after 5 business days.\n"
+    "Equipment provided 'as is' with standard manufacturer warranty."
+)
+
+TEXTS = [
+    "",
+    "short text",
+    PARAGRAPH,
+    "\n\n".join([PARAGRAPH] * 20),
+    "\n".join(f"{i}. Term number {i} of the agreement." for i in range(200)),
+    "x" * 2500,
+    "word " * 700,
+    "mixed\n\nseparators\nand  spaces " * 80,
+]
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("chunk_size,chunk_overlap", [(1000, 200), (100, 20), (50, 0)])
+def test_matches_langchain(text, chunk_size, chunk_overlap):
+    """Test that the chunks are identical to LangChain's splitter."""
+    fast = FastRecursiveTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=len)
+    reference = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=len)
+    assert fast.split_text(text) == reference.split_text(text)
+
+@pytest.mark.parametrize("keep_separator", [False, "start", "end"])
+def test_matches_langchain_keep_separator(keep_separator):
+    """Test the keep_separator variants against LangChain's splitter."""
+    text = "\n\n".join([PARAGRAPH] * 10)
+    fast = FastRecursiveTextSplitter(chunk_size=120, chunk_overlap=30, keep_separator=keep_separator)
+    reference = RecursiveCharacterTextSplitter(chunk_size=120, chunk_overlap=30, keep_separator=keep_separator)
+    assert fast.split_text(text) == reference.split_text(text)
+
+def test_custom_separators_are_literal():
+    """Test that regex metacharacters in separators are matched literally."""
+    text = "a.b|c.d|" * 50
+    fast = FastRecursiveTextSplitter(separators=["|", ".", ""], chunk_size=20, chunk_overlap=0)
+    reference = RecursiveCharacterTextSplitter(separators=["|", ".", ""], chunk_size=20, chunk_overlap=0)
+    assert fast.split_text(text) == reference.split_text(text)
+
+def test_regex_separators_rejected():
+    """Test that regex separators are not supported."""
+    with pytest.raises(ValueError):
+        FastRecursiveTextSplitter(is_separator_regex=True)
@@ -0,0 +1,77 @@
+"""
+Tests for the vectorized similarity helpers.
+"""
+
+import numpy as np
+import pytest
+from src.utils.vector_ops import normalize, quantize_int8, top_k_cosine, top_k_cosine_int8
+
+# Normalized random candidate rows
+MATRIX = normalize(np.random.default_rng(0).standard_normal((50, 16)))
+
+def test_normalize_unit_rows():
+    """Test that every non-zero row gets unit length."""
+    result = normalize([[3.0, 4.0], [0.0, 2.0]])
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, [[0.6, 0.8], [0.0, 1.0]], rtol=1e-6)
+
+def test_normalize_zero_row_unchanged():
+    """Test that zero rows are returned as zeros instead of NaN."""
+    result = normalize([[0.0, 0.0], [1.0, 0.0]])
+    np.testing.assert_array_equal(result[0], [0.0, 0.0])
+
+def test_normalize_single_vector():
+    """Test normalization of a 1-D vector."""
+    np.testing.assert_allclose(normalize([0.0, 5.0]), [0.0, 1.0])
+
+def test_top_k_cosine_matches_full_sort():
+    """Test that the top k rows and scores match a full sort, best first."""
+    query = MATRIX[7]
+    top, scores = top_k_cosine(query, MATRIX, k=5)
+    expected = np.argsort(-(MATRIX @ query))[:5]
+    np.testing.assert_array_equal(top, expected)
+    assert top[0] == 7
+    assert np.all(np.diff(scores) <= 0)
+
+def test_top_k_cosine_k_larger_than_rows():
+    """Test that k is capped at the number of rows."""
+    top, scores = top_k_cosine(MATRIX[0], MATRIX[:3], k=10)
+    assert len(top) == 3
+    assert len(scores) == 3
+
+def test_top_k_cosine_empty():
+    """Test empty results for an empty matrix or k <= 0."""
+    top, scores = top_k_cosine(np.ones(4, dtype=np.float32), np.empty((0, 4), dtype=np.float32), k=3)
+    assert top.size == 0 and scores.size == 0
+    top, _ = top_k_cosine(np.ones(4, dtype=np.float32), np.ones((2, 4), dtype=np.float32), k=0)
+    assert top.size == 0
+
+def test_quantize_int8_round_trip():
+    """Test that dequantized rows are close to the originals."""
+    quantized, scales = quantize_int8(MATRIX)
+    assert quantized.dtype == np.int8
+    assert scales.shape == (MATRIX.shape[0],)
+    np.testing.assert_allclose(quantized / scales[:, np.newaxis], MATRIX, atol=0.01)
+
+def test_quantize_int8_zero_row():
+    """Test that a zero row quantizes to zeros with a finite scale."""
+    quantized, scales = quantize_int8([[0.0, 0.0]])
+    np.testing.assert_array_equal(quantized, [[0, 0]])
+    assert np.isfinite(scales).all()
+
+@pytest.mark.parametrize("block_rows", [1, 7, 1024])
+def test_top_k_cosine_int8_matches_float(block_rows):
+    """Test that the int8 search finds the same neighbours as the float32 search."""
+    quantized, scales = quantize_int8(MATRIX)
+    query = MATRIX[11]
+    top, scores = top_k_cosine_int8(query, quantized, scales, k=3, block_rows=block_rows)
+    expected, expected_scores = top_k_cosine(query, MATRIX, k=3)
+    np.testing.assert_array_equal(top, expected)
+    np.testing.assert_allclose(scores, expected_scores, atol=0.02)
+
+def test_top_k_cosine_int8_empty():
+    """Test empty results for an empty matrix."""
+    top, scores = top_k_cosine_int8(
+        np.ones(4, dtype=np.float32), np.empty((0, 4), dtype=np.int8), np.empty(0, dtype=np.float32), k=3
+    )
+    assert top.size == 0 and scores.size == 0